@@ -0,0 +1,457 @@
+"""
+Numeric core of the opportunity scorer used by the Momentum Hunter page.
+
+Only floats and booleans cross these functions, so they are JIT-compiled
+by Numba when it is installed, or compiled ahead of time by
+build_scoring_ext.py. Both are optional; without Numba they run as
+plain Python, and score_arrays is the NumPy version of score_core used
+for batches.
+"""
+
+import hashlib
+import inspect
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # optional JIT for the scoring core
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba isn't installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Volume sigmoid 1 / (1 + exp(-1.5 * (log10(volume) - 5.7))), rewritten as
+# 1 / (1 + (10**5.7 / volume) ** (1.5 / ln 10)) to skip the log10 and exp
+VOLUME_MIDPOINT = 10 ** 5.7
+VOLUME_EXPONENT = 1.5 / math.log(10)
+
+# Numba signature of score_core: nine floats and the sweet-spot flag, from
+# (current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+# is_yes, is_no, one_day_change, one_week_change, annualized_yield, charm)
+SCORE_CORE_SIGNATURE = (
+    "Tuple((f8, f8, f8, f8, f8, f8, f8, f8, f8, b1))"
+    "(f8, f8, f8, f8, f8, f8, b1, b1, f8, f8, f8, f8)"
+)
+
+
+@njit(cache=True)
+def score_core(
+    current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+    is_yes, is_no, one_day_change, one_week_change, annualized_yield, charm
+):
+    """
+    Numeric scoring pipeline behind calculate_opportunity_score.
+    
+    Takes floats plus direction flags (a missing bid/ask is 0.0) and
+    returns (total_score, distance_time_fit, apy, volume, spread,
+    momentum, charm, distance_to_target, days_to_expiry, in_sweet_spot).
+    """
+    
+    # Calculate distance to target
+    if is_yes:
+        distance_to_target = 1.0 - current_prob
+    else:
+        distance_to_target = current_prob
+    
+    days_to_expiry = hours_to_expiry / 24
+    
+    # =================================================================
+    # 1. DISTANCE-TIME FIT SCORE (0-100) - 35% weight
+    # Multi-modal function with sweet spot at 2-5% distance, 7-10 days
+    # =================================================================
+    
+    # Distance component: Gaussian curve peaked at 3.5% (midpoint of 2-5%)
+    optimal_distance = 0.035  # 3.5%
+    distance_sigma = 0.015    # Controls width of optimal zone
+    
+    # Gaussian formula: exp(-((x - mu)^2) / (2 * sigma^2))
+    distance_deviation = (distance_to_target - optimal_distance) ** 2
+    
+    # Time component: Gaussian curve peaked at 8.5 days (midpoint of 7-10)
+    optimal_days = 8.5
+    time_sigma = 2.0  # Controls width of optimal zone
+    
+    time_deviation = (days_to_expiry - optimal_days) ** 2
+    
+    # Combined distance-time fit with interaction term
+    # When both are optimal, score is maximized. The product of the two
+    # Gaussians is taken as one exp: exp(a) * exp(b) == exp(a + b)
+    distance_time_fit = math.exp(
+        -distance_deviation / (2 * distance_sigma ** 2)
+        - time_deviation / (2 * time_sigma ** 2)
+    )
+    
+    # Boost for being in the exact sweet spot (2-5% distance AND 7-10 days)
+    in_sweet_spot = (0.02 <= distance_to_target <= 0.05) and (7 <= days_to_expiry <= 10)
+    if in_sweet_spot:
+        distance_time_fit = min(1.0, distance_time_fit * 1.3)
+    
+    # Polynomial penalty for extreme distances (too close to 0% or 100%)
+    # Sigmoid function to smoothly penalize distances < 1% or > 20%
+    if distance_to_target < 0.01:  # Very close to extreme
+        extreme_penalty = 1.0 / (1.0 + math.exp(10 * (distance_to_target - 0.005)))
+        distance_time_fit *= extreme_penalty
+    elif distance_to_target > 0.20:  # Too far from extreme
+        far_penalty = 1.0 / (1.0 + math.exp(-10 * (distance_to_target - 0.25)))
+        distance_time_fit *= far_penalty
+    
+    distance_time_score = distance_time_fit * 100
+    
+    # =================================================================
+    # 2. APY SCORE (0-100) - 25% weight
+    # Logarithmic scale with smooth transitions
+    # =================================================================
+    apy_decimal = annualized_yield
+    
+    if apy_decimal <= 0:
+        apy_score = 0.0
+    elif apy_decimal < 0.50:  # <50% APY
+        # Polynomial: x^0.7 for diminishing returns at low APY
+        apy_score = (apy_decimal / 0.50) ** 0.7 * 20
+    elif apy_decimal < 1.0:  # 50-100% APY
+        apy_score = 20 + ((apy_decimal - 0.50) / 0.50) ** 0.8 * 20
+    elif apy_decimal < 5.0:  # 100-500% APY
+        log_progress = math.log10(apy_decimal) / math.log10(5.0)
+        apy_score = 40 + log_progress * 30
+    elif apy_decimal < 10.0:  # 500-1000% APY
+        log_progress = (math.log10(apy_decimal) - math.log10(5.0)) / (math.log10(10.0) - math.log10(5.0))
+        apy_score = 70 + log_progress * 20
+    else:  # >1000% APY
+        log_progress = min(1.0, (math.log10(apy_decimal) - math.log10(10.0)) / 1.0)
+        apy_score = 85 + log_progress * 15
+    
+    apy_score = min(100.0, apy_score)
+    
+    # =================================================================
+    # 3. VOLUME SCORE (0-100) - 15% weight
+    # Smooth S-curve for liquidity assessment
+    # =================================================================
+    if volume <= 0:
+        volume_score = 0.0
+    else:
+        # S-curve (sigmoid): 1 / (1 + exp(-k * (x - midpoint)))
+        # Midpoint at 500k, inflection creates smooth transition
+        # Sigmoid centered at log10(500k) = 5.7, steepness 1.5; with
+        # x = log10(volume) the exp term is a power of the volume ratio
+        sigmoid = 1.0 / (1.0 + (VOLUME_MIDPOINT / max(volume, 1.0)) ** VOLUME_EXPONENT)
+        volume_score = sigmoid * 100
+        
+        # Boost for very high volume (>2M)
+        if volume > 2_000_000:
+            volume_bonus = min(0.2, (volume - 2_000_000) / 10_000_000)
+            volume_score = min(100.0, volume_score * (1.0 + volume_bonus))
+    
+    volume_score = min(100.0, volume_score)
+    
+    # =================================================================
+    # 4. SPREAD QUALITY SCORE (0-100) - 10% weight
+    # Polynomial curve rewarding tight spreads
+    # =================================================================
+    if best_ask > 0 and best_bid > 0:
+        spread = best_ask - best_bid
+        spread_pct = spread / best_ask
+        
+        # Inverse polynomial: tighter spread = higher score
+        # Perfect spread (0%) = 100, 10% spread = ~0
+        if spread_pct <= 0:
+            spread_score = 100.0
+        else:
+            # Polynomial decay: (1 - (spread/0.10))^2 * 100
+            normalized_spread = min(spread_pct / 0.10, 1.0)
+            spread_score = ((1.0 - normalized_spread) ** 1.5) * 100
+    else:
+        spread_score = 30.0  # Default for missing spread data
+    
+    spread_score = max(0.0, min(100.0, spread_score))
+    
+    # =================================================================
+    # 5. MOMENTUM SCORE (0-100) - 10% weight
+    # With directional consistency bonus (polynomial)
+    # =================================================================
+    momentum_score = momentum * 100
+    
+    # Consistency bonus using polynomial multiplier
+    short_term_aligned = (is_yes and one_day_change > 0) or (is_no and one_day_change < 0)
+    long_term_aligned = (is_yes and one_week_change > 0) or (is_no and one_week_change < 0)
+    
+    # Track counter-trend risk for final penalty
+    is_counter_trend = False
+    
+    if short_term_aligned and long_term_aligned:
+        # Both aligned: stronger polynomial boost
+        consistency_factor = 1.5  # Increased from 1.25
+        momentum_score = min(100.0, momentum_score * consistency_factor)
+    elif short_term_aligned or long_term_aligned:
+        # One aligned: neutral baseline (no boost/penalty to momentum itself)
+        consistency_factor = 1.0  # Changed from 1.1
+        momentum_score = min(100.0, momentum_score * consistency_factor)
+    else:
+        # Neither aligned: stronger polynomial penalty + risk flag
+        consistency_factor = 0.5  # Increased penalty from 0.65
+        momentum_score *= consistency_factor
+        is_counter_trend = True  # Flag for additional overall penalty
+    
+    momentum_score = min(100.0, momentum_score)
+    
+    # =================================================================
+    # 6. CHARM SCORE (0-100) - 5% weight
+    # Polynomial scaling for acceleration
+    # =================================================================
+    abs_charm = abs(charm)
+    
+    if abs_charm <= 0:
+        charm_score = 0.0
+    elif abs_charm < 2.0:  # <2pp/day
+        # Quadratic growth for low charm
+        charm_score = (abs_charm / 2.0) ** 2 * 40
+    elif abs_charm < 5.0:  # 2-5pp/day
+        charm_score = 40 + ((abs_charm - 2.0) / 3.0) ** 1.5 * 30
+    elif abs_charm < 10.0:  # 5-10pp/day
+        charm_score = 70 + ((abs_charm - 5.0) / 5.0) ** 1.2 * 20
+    else:  # >10pp/day
+        # Logarithmic for extreme charm (diminishing returns)
+        log_charm = min(1.0, math.log10(abs_charm - 9) / 1.0)
+        charm_score = 90 + log_charm * 10
+    
+    charm_score = min(100.0, charm_score)
+    
+    # =================================================================
+    # 7. DYNAMIC WEIGHTING based on context
+    # Smooth transitions instead of hard cutoffs
+    # =================================================================
+    w_distance_time = 0.35
+    w_apy = 0.25
+    w_volume = 0.15
+    w_spread = 0.10
+    w_momentum = 0.10
+    w_charm = 0.05
+    
+    # Adjust weights based on time horizon (smooth sigmoid)
+    if days_to_expiry < 3:  # Very short-term
+        # Increase spread and charm importance
+        shift = min(0.08, (3 - days_to_expiry) / 10)
+        w_spread += shift / 2
+        w_charm += shift / 2
+        w_apy -= shift
+    elif days_to_expiry > 14:  # Long-term
+        # Increase volume importance
+        shift = min(0.08, (days_to_expiry - 14) / 30)
+        w_volume += shift
+        w_distance_time -= shift
+    
+    # Adjust based on distance from sweet spot (polynomial)
+    distance_from_sweet_spot = abs(distance_to_target - optimal_distance) / optimal_distance
+    if distance_from_sweet_spot > 0.5:
+        # Far from sweet spot: APY matters more
+        shift = min(0.10, distance_from_sweet_spot * 0.15)
+        w_apy += shift
+        w_distance_time -= shift
+    
+    # =================================================================
+    # 8. FINAL SCORE - Weighted combination
+    # No hard penalties, all handled by smooth component scores
+    # =================================================================
+    raw_score = (
+        distance_time_score * w_distance_time +
+        apy_score * w_apy +
+        volume_score * w_volume +
+        spread_score * w_spread +
+        momentum_score * w_momentum +
+        charm_score * w_charm
+    )
+    
+    # Apply counter-trend risk penalty if momentum is misaligned
+    # This creates additional ~5% penalty beyond the momentum component reduction
+    if is_counter_trend:
+        risk_penalty = 0.95  # 5% overall reduction for counter-trend setups
+    else:
+        risk_penalty = 1.0
+    
+    final_score = min(100.0, max(0.0, raw_score * risk_penalty))
+    
+    return (
+        final_score,
+        distance_time_score, apy_score, volume_score, spread_score, momentum_score, charm_score,
+        distance_to_target,
+        days_to_expiry,
+        in_sweet_spot
+    )
+
+
+@njit(parallel=True, cache=True)
+def score_batch(
+    current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+    is_yes, is_no, one_day_change, one_week_change, annualized_yield, charm, out
+):
+    """
+    Run score_core over 1-D input arrays, in parallel when compiled.
+    
+    Row i of the preallocated (n, 10) float array out receives the
+    score_core tuple for scenario i (in_sweet_spot as 0.0/1.0).
+    """
+    for i in prange(current_prob.shape[0]):
+        (out[i, 0], out[i, 1], out[i, 2], out[i, 3], out[i, 4], out[i, 5], out[i, 6],
+         out[i, 7], out[i, 8], in_sweet_spot) = score_core(
+            current_prob[i], momentum[i], hours_to_expiry[i], volume[i],
+            best_bid[i], best_ask[i], is_yes[i], is_no[i],
+            one_day_change[i], one_week_change[i], annualized_yield[i], charm[i]
+        )
+        out[i, 9] = 1.0 if in_sweet_spot else 0.0
+
+
+def score_arrays(
+    current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+    is_yes, is_no, one_day_change, one_week_change, annualized_yield, charm
+) -> tuple:
+    """
+    score_core over broadcast NumPy arrays, in one vectorized pass.
+    
+    Used by calculate_opportunity_score_batch when Numba isn't installed,
+    so it must stay in step with score_core; returns arrays in the same
+    order (in_sweet_spot as a bool array).
+    """
+    # Branches are evaluated for every element and masked afterwards, so
+    # out-of-domain values in unused branches are expected here.
+    # Clamps written min(c, x) / max(c, x) in score_core use fmin/fmax:
+    # like Python's min/max, they keep the constant when x is NaN.
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        distance_to_target = np.where(is_yes, 1.0 - current_prob, current_prob)
+        days_to_expiry = hours_to_expiry / 24
+        
+        # 1. DISTANCE-TIME FIT
+        optimal_distance = 0.035
+        distance_sigma = 0.015
+        optimal_days = 8.5
+        time_sigma = 2.0
+        
+        # Product of the distance and time Gaussians, as a single exp
+        distance_time_fit = np.exp(
+            -(distance_to_target - optimal_distance) ** 2 / (2 * distance_sigma ** 2)
+            - (days_to_expiry - optimal_days) ** 2 / (2 * time_sigma ** 2)
+        )
+        
+        in_sweet_spot = (
+            (distance_to_target >= 0.02) & (distance_to_target <= 0.05) &
+            (days_to_expiry >= 7) & (days_to_expiry <= 10)
+        )
+        distance_time_fit = np.where(in_sweet_spot, np.fmin(1.0, distance_time_fit * 1.3), distance_time_fit)
+        
+        extreme_penalty = 1.0 / (1.0 + np.exp(10 * (distance_to_target - 0.005)))
+        far_penalty = 1.0 / (1.0 + np.exp(-10 * (distance_to_target - 0.25)))
+        distance_time_fit = distance_time_fit * np.select(
+            [distance_to_target < 0.01, distance_to_target > 0.20],
+            [extreme_penalty, far_penalty],
+            default=1.0
+        )
+        distance_time_score = distance_time_fit * 100
+        
+        # 2. APY SCORE
+        apy = annualized_yield
+        log_apy = np.log10(apy)
+        apy_score = np.select(
+            [apy <= 0, apy < 0.50, apy < 1.0, apy < 5.0, apy < 10.0],
+            [
+                0.0,
+                (apy / 0.50) ** 0.7 * 20,
+                20 + ((apy - 0.50) / 0.50) ** 0.8 * 20,
+                40 + log_apy / math.log10(5.0) * 30,
+                70 + (log_apy - math.log10(5.0)) / (math.log10(10.0) - math.log10(5.0)) * 20,
+            ],
+            default=85 + np.fmin(1.0, (log_apy - math.log10(10.0)) / 1.0) * 15
+        )
+        apy_score = np.fmin(100, apy_score)
+        
+        # 3. VOLUME SCORE
+        sigmoid = 1.0 / (1.0 + (VOLUME_MIDPOINT / np.maximum(volume, 1)) ** VOLUME_EXPONENT)
+        volume_score = sigmoid * 100
+        volume_bonus = np.fmin(0.2, (volume - 2_000_000) / 10_000_000)
+        volume_score = np.where(volume > 2_000_000, np.fmin(100, volume_score * (1.0 + volume_bonus)), volume_score)
+        volume_score = np.fmin(100, np.where(volume <= 0, 0.0, volume_score))
+        
+        # 4. SPREAD QUALITY SCORE
+        has_quotes = (best_bid > 0) & (best_ask > 0)
+        spread_pct = (best_ask - best_bid) / best_ask
+        normalized_spread = np.minimum(spread_pct / 0.10, 1.0)
+        spread_score = np.where(spread_pct <= 0, 100.0, ((1.0 - normalized_spread) ** 1.5) * 100)
+        spread_score = np.where(has_quotes, spread_score, 30.0)
+        spread_score = np.fmax(0, np.fmin(100, spread_score))
+        
+        # 5. MOMENTUM SCORE
+        momentum_score = momentum * 100
+        short_term_aligned = (is_yes & (one_day_change > 0)) | (is_no & (one_day_change < 0))
+        long_term_aligned = (is_yes & (one_week_change > 0)) | (is_no & (one_week_change < 0))
+        is_counter_trend = ~short_term_aligned & ~long_term_aligned
+        momentum_score = np.select(
+            [short_term_aligned & long_term_aligned, short_term_aligned | long_term_aligned],
+            [np.fmin(100, momentum_score * 1.5), np.fmin(100, momentum_score * 1.0)],
+            default=momentum_score * 0.5
+        )
+        momentum_score = np.fmin(100, momentum_score)
+        
+        # 6. CHARM SCORE
+        abs_charm = np.abs(charm)
+        charm_score = np.select(
+            [abs_charm <= 0, abs_charm < 2.0, abs_charm < 5.0, abs_charm < 10.0],
+            [
+                0.0,
+                (abs_charm / 2.0) ** 2 * 40,
+                40 + ((abs_charm - 2.0) / 3.0) ** 1.5 * 30,
+                70 + ((abs_charm - 5.0) / 5.0) ** 1.2 * 20,
+            ],
+            default=90 + np.fmin(1.0, np.log10(abs_charm - 9) / 1.0) * 10
+        )
+        charm_score = np.fmin(100, charm_score)
+        
+        # 7. DYNAMIC WEIGHTING
+        short_shift = np.where(days_to_expiry < 3, np.fmin(0.08, (3 - days_to_expiry) / 10), 0.0)
+        long_shift = np.where(days_to_expiry > 14, np.fmin(0.08, (days_to_expiry - 14) / 30), 0.0)
+        distance_from_sweet_spot = np.abs(distance_to_target - optimal_distance) / optimal_distance
+        apy_shift = np.where(distance_from_sweet_spot > 0.5, np.fmin(0.10, distance_from_sweet_spot * 0.15), 0.0)
+        
+        w_distance_time = 0.35 - long_shift - apy_shift
+        w_apy = 0.25 - short_shift + apy_shift
+        w_volume = 0.15 + long_shift
+        w_spread = 0.10 + short_shift / 2
+        w_momentum = 0.10
+        w_charm = 0.05 + short_shift / 2
+        
+        # 8. FINAL SCORE
+        raw_score = (
+            distance_time_score * w_distance_time +
+            apy_score * w_apy +
+            volume_score * w_volume +
+            spread_score * w_spread +
+            momentum_score * w_momentum +
+            charm_score * w_charm
+        )
+        risk_penalty = np.where(is_counter_trend, 0.95, 1.0)
+        final_score = np.fmin(100, np.fmax(0, raw_score * risk_penalty))
+    
+    return (
+        final_score,
+        distance_time_score, apy_score, volume_score, spread_score, momentum_score, charm_score,
+        distance_to_target,
+        days_to_expiry,
+        in_sweet_spot
+    )
+
+
+def source_hash() -> int:
+    """
+    Fingerprint of score_core's source and the constants baked into it.
+    
+    build_scoring_ext.py embeds this in compiled extensions so app.py can
+    ignore one built from an older version of this file.
+    """
+    source = inspect.getsource(getattr(score_core, 'py_func', score_core))
+    text = source + repr((VOLUME_MIDPOINT, VOLUME_EXPONENT))
+    # 60 bits, so it fits a signed 64-bit integer in the compiled builds
+    return int(hashlib.sha256(text.encode('utf-8')).hexdigest()[:15], 16)
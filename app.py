@@ -6,9 +6,12 @@ Surfaces high-conviction trades from tracked users with consensus signals.
 import streamlit as st
 from datetime import datetime, timedelta
 import asyncio
-from typing import List, Dict, Optional, Tuple
+import importlib
+from typing import List, Dict, NamedTuple, Optional, Tuple
 import logging
 import math
+from functools import lru_cache
+import numpy as np
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,6 +31,41 @@ from clients.api_pool import fetch_all_data, APIPool
 from clients.leaderboard_client import LeaderboardClient
 from utils.user_tracker import get_user_tracker
 from algorithms.conviction_scorer import ConvictionScorer
+from algorithms.opportunity_core import (
+    HAS_NUMBA, score_core, score_batch, score_arrays, source_hash
+)
+
+# Ahead-of-time compiled scoring cores built by build_scoring_ext.py, in preference order
+_COMPILED_SCORE_CORES = ('algorithms._opportunity_core_aot', 'algorithms._opportunity_core_cy')
+
+
+def _load_compiled_score_core():
+    """
+    Return a compiled score_core built from the current opportunity_core
+    source, or None. Extensions are untracked build products, so one left
+    over from an older source is skipped rather than silently diverging
+    from the JIT-compiled batch path.
+    """
+    expected_hash = None
+    for module_name in _COMPILED_SCORE_CORES:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if expected_hash is None:
+            expected_hash = source_hash()
+        built_hash = getattr(module, 'source_hash', None)
+        if built_hash is None or built_hash() != expected_hash:
+            logger.warning(f"Ignoring stale {module_name}; rebuild it with build_scoring_ext.py")
+            continue
+        return module.score_core
+    return None
+
+
+_score_core = _load_compiled_score_core() or score_core
+if HAS_NUMBA:
+    # Compile once at import so the first real score isn't slow
+    _score_core(0.965, 0.3, 204.0, 1e6, 0.96, 0.97, True, False, 0.05, 0.1, 3.0, 6.0)
 
 # Initialize
 tracker = get_user_tracker()
@@ -956,6 +994,41 @@ def calculate_composite_momentum(current_price: float, price_change: float) -> d
     }
 
 
+# Grade bands for opportunity scores: (minimum score, grade, color).
+# The last band catches everything below the previous threshold.
+_GRADE_BANDS = (
+    (85, "A+", "#27ae60"),
+    (75, "A", "#2ecc71"),
+    (65, "B+", "#f1c40f"),
+    (55, "B", "#f39c12"),
+    (45, "C+", "#e67e22"),
+    (35, "C", "#e74c3c"),
+    (-math.inf, "D", "#c0392b"),
+)
+
+class ScoreComponents(NamedTuple):
+    """Per-metric scores (0-100), in the order the scoring core returns them."""
+    
+    distance_time_fit: float
+    apy: float
+    volume: float
+    spread: float
+    momentum: float
+    charm: float
+
+
+class ScoreResult(NamedTuple):
+    """Result of calculate_opportunity_score."""
+    
+    total_score: float
+    grade: str
+    grade_color: str
+    components: ScoreComponents
+    distance_to_target: float
+    days_to_expiry: float
+    in_sweet_spot: bool
+
+
 def calculate_opportunity_score(
     current_prob: float,
     momentum: float,
@@ -968,7 +1041,7 @@ def calculate_opportunity_score(
     one_week_change: float = 0,
     annualized_yield: float = 0,
     charm: float = 0
-) -> dict:
+) -> ScoreResult:
     """
     Multi-modal scoring function optimized for 2-5% distance, 7-10 day window sweet spot.
     
@@ -983,250 +1056,154 @@ def calculate_opportunity_score(
     - Momentum (10%): Directional strength
     - Charm (5%): Acceleration factor
     
-    Returns dict with total_score (0-100), grade, and components.
-    """
-    
-    # Calculate distance to target
-    if direction == 'YES':
-        distance_to_target = 1.0 - current_prob
-    else:
-        distance_to_target = current_prob
-    
-    days_to_expiry = hours_to_expiry / 24
-    
-    # =================================================================
-    # 1. DISTANCE-TIME FIT SCORE (0-100) - 35% weight
-    # Multi-modal function with sweet spot at 2-5% distance, 7-10 days
-    # =================================================================
-    
-    # Distance component: Gaussian curve peaked at 3.5% (midpoint of 2-5%)
-    optimal_distance = 0.035  # 3.5%
-    distance_sigma = 0.015    # Controls width of optimal zone
-    
-    # Gaussian formula: exp(-((x - mu)^2) / (2 * sigma^2))
-    distance_deviation = (distance_to_target - optimal_distance) ** 2
-    distance_fitness = math.exp(-distance_deviation / (2 * distance_sigma ** 2))
-    
-    # Time component: Gaussian curve peaked at 8.5 days (midpoint of 7-10)
-    optimal_days = 8.5
-    time_sigma = 2.0  # Controls width of optimal zone
-    
-    time_deviation = (days_to_expiry - optimal_days) ** 2
-    time_fitness = math.exp(-time_deviation / (2 * time_sigma ** 2))
-    
-    # Combined distance-time fit with interaction term
-    # When both are optimal, score is maximized
-    distance_time_fit = distance_fitness * time_fitness
-    
-    # Boost for being in the exact sweet spot (2-5% distance AND 7-10 days)
-    in_sweet_spot = (0.02 <= distance_to_target <= 0.05) and (7 <= days_to_expiry <= 10)
-    if in_sweet_spot:
-        distance_time_fit = min(1.0, distance_time_fit * 1.3)
-    
-    # Polynomial penalty for extreme distances (too close to 0% or 100%)
-    # Sigmoid function to smoothly penalize distances < 1% or > 20%
-    if distance_to_target < 0.01:  # Very close to extreme
-        extreme_penalty = 1.0 / (1.0 + math.exp(10 * (distance_to_target - 0.005)))
-        distance_time_fit *= extreme_penalty
-    elif distance_to_target > 0.20:  # Too far from extreme
-        far_penalty = 1.0 / (1.0 + math.exp(-10 * (distance_to_target - 0.25)))
-        distance_time_fit *= far_penalty
-    
-    distance_time_score = distance_time_fit * 100
-    
-    # =================================================================
-    # 2. APY SCORE (0-100) - 25% weight
-    # Logarithmic scale with smooth transitions
-    # =================================================================
-    apy_decimal = annualized_yield
-    
-    if apy_decimal <= 0:
-        apy_score = 0
-    elif apy_decimal < 0.50:  # <50% APY
-        # Polynomial: x^0.7 for diminishing returns at low APY
-        apy_score = (apy_decimal / 0.50) ** 0.7 * 20
-    elif apy_decimal < 1.0:  # 50-100% APY
-        apy_score = 20 + ((apy_decimal - 0.50) / 0.50) ** 0.8 * 20
-    elif apy_decimal < 5.0:  # 100-500% APY
-        log_progress = math.log10(apy_decimal) / math.log10(5.0)
-        apy_score = 40 + log_progress * 30
-    elif apy_decimal < 10.0:  # 500-1000% APY
-        log_progress = (math.log10(apy_decimal) - math.log10(5.0)) / (math.log10(10.0) - math.log10(5.0))
-        apy_score = 70 + log_progress * 20
-    else:  # >1000% APY
-        log_progress = min(1.0, (math.log10(apy_decimal) - math.log10(10.0)) / 1.0)
-        apy_score = 85 + log_progress * 15
-    
-    apy_score = min(100, apy_score)
-    
-    # =================================================================
-    # 3. VOLUME SCORE (0-100) - 15% weight
-    # Smooth S-curve for liquidity assessment
-    # =================================================================
-    if volume <= 0:
-        volume_score = 0
-    else:
-        # S-curve (sigmoid): 1 / (1 + exp(-k * (x - midpoint)))
-        # Midpoint at 500k, inflection creates smooth transition
-        log_volume = math.log10(max(volume, 1))
-        
-        # Sigmoid centered at log10(500k) = 5.7
-        volume_midpoint = 5.7
-        volume_steepness = 1.5
-        
-        sigmoid = 1.0 / (1.0 + math.exp(-volume_steepness * (log_volume - volume_midpoint)))
-        volume_score = sigmoid * 100
-        
-        # Boost for very high volume (>2M)
-        if volume > 2_000_000:
-            volume_bonus = min(0.2, (volume - 2_000_000) / 10_000_000)
-            volume_score = min(100, volume_score * (1.0 + volume_bonus))
-    
-    volume_score = min(100, volume_score)
-    
-    # =================================================================
-    # 4. SPREAD QUALITY SCORE (0-100) - 10% weight
-    # Polynomial curve rewarding tight spreads
-    # =================================================================
-    if best_bid is not None and best_ask is not None and best_ask > 0 and best_bid > 0:
-        spread = best_ask - best_bid
-        spread_pct = spread / best_ask
-        
-        # Inverse polynomial: tighter spread = higher score
-        # Perfect spread (0%) = 100, 10% spread = ~0
-        if spread_pct <= 0:
-            spread_score = 100
-        else:
-            # Polynomial decay: (1 - (spread/0.10))^2 * 100
-            normalized_spread = min(spread_pct / 0.10, 1.0)
-            spread_score = ((1.0 - normalized_spread) ** 1.5) * 100
-    else:
-        spread_score = 30  # Default for missing spread data
+    Results are memoized on the input values, so repeated scenarios
+    (dashboard refreshes, validation re-runs) skip the arithmetic.
     
-    spread_score = max(0, min(100, spread_score))
+    Returns a ScoreResult with total_score (0-100), grade, and components.
+    """
+    return _score_cached(
+        current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+        direction, one_day_change, one_week_change, annualized_yield, charm
+    )
+
+
+class ScoringInputs(NamedTuple):
+    """Positional bundle of calculate_opportunity_score arguments."""
+    
+    current_prob: float
+    momentum: float
+    hours_to_expiry: float
+    volume: float
+    best_bid: Optional[float]
+    best_ask: Optional[float]
+    direction: str
+    one_day_change: float = 0
+    one_week_change: float = 0
+    annualized_yield: float = 0
+    charm: float = 0
+
+
+def score_inputs(inputs: ScoringInputs) -> ScoreResult:
+    """
+    Score a prepared ScoringInputs bundle.
     
-    # =================================================================
-    # 5. MOMENTUM SCORE (0-100) - 10% weight
-    # With directional consistency bonus (polynomial)
-    # =================================================================
-    momentum_score = momentum * 100
-    
-    # Consistency bonus using polynomial multiplier
-    short_term_aligned = (direction == 'YES' and one_day_change > 0) or (direction == 'NO' and one_day_change < 0)
-    long_term_aligned = (direction == 'YES' and one_week_change > 0) or (direction == 'NO' and one_week_change < 0)
-    
-    # Track counter-trend risk for final penalty
-    is_counter_trend = False
-    
-    if short_term_aligned and long_term_aligned:
-        # Both aligned: stronger polynomial boost
-        consistency_factor = 1.5  # Increased from 1.25
-        momentum_score = min(100, momentum_score * consistency_factor)
-    elif short_term_aligned or long_term_aligned:
-        # One aligned: neutral baseline (no boost/penalty to momentum itself)
-        consistency_factor = 1.0  # Changed from 1.1
-        momentum_score = min(100, momentum_score * consistency_factor)
-    else:
-        # Neither aligned: stronger polynomial penalty + risk flag
-        consistency_factor = 0.5  # Increased penalty from 0.65
-        momentum_score *= consistency_factor
-        is_counter_trend = True  # Flag for additional overall penalty
+    Same result as calculate_opportunity_score(**params), but the inputs
+    go straight to the memoized core without keyword unpacking.
+    """
+    return _score_cached(*inputs)
+
+
+@lru_cache(maxsize=4096)
+def _score_cached(
+    current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+    direction, one_day_change, one_week_change, annualized_yield, charm
+) -> ScoreResult:
+    """
+    Positional, memoized core of calculate_opportunity_score.
     
-    momentum_score = min(100, momentum_score)
+    The ScoreResult is immutable, so the cached entry is returned as is.
+    """
+    # Only floats and flags cross into the compiled core; a missing
+    # quote becomes 0.0, which takes the same "no spread data" branch
+    (final_score, distance_time_score, apy_score, volume_score, spread_score,
+     momentum_score, charm_score, distance_to_target, days_to_expiry, in_sweet_spot) = _score_core(
+        float(current_prob), float(momentum), float(hours_to_expiry), float(volume),
+        0.0 if best_bid is None else float(best_bid),
+        0.0 if best_ask is None else float(best_ask),
+        direction == 'YES', direction == 'NO',
+        float(one_day_change), float(one_week_change), float(annualized_yield), float(charm)
+    )
     
     # =================================================================
-    # 6. CHARM SCORE (0-100) - 5% weight
-    # Polynomial scaling for acceleration
+    # 9. GRADE based on final score
     # =================================================================
-    abs_charm = abs(charm)
-    
-    if abs_charm <= 0:
-        charm_score = 0
-    elif abs_charm < 2.0:  # <2pp/day
-        # Quadratic growth for low charm
-        charm_score = (abs_charm / 2.0) ** 2 * 40
-    elif abs_charm < 5.0:  # 2-5pp/day
-        charm_score = 40 + ((abs_charm - 2.0) / 3.0) ** 1.5 * 30
-    elif abs_charm < 10.0:  # 5-10pp/day
-        charm_score = 70 + ((abs_charm - 5.0) / 5.0) ** 1.2 * 20
-    else:  # >10pp/day
-        # Logarithmic for extreme charm (diminishing returns)
-        log_charm = min(1.0, math.log10(abs_charm - 9) / 1.0)
-        charm_score = 90 + log_charm * 10
-    
-    charm_score = min(100, charm_score)
+    for min_score, grade, grade_color in _GRADE_BANDS:
+        if final_score >= min_score:
+            break
+    
+    return ScoreResult(
+        final_score,
+        grade,
+        grade_color,
+        ScoreComponents(distance_time_score, apy_score, volume_score, spread_score, momentum_score, charm_score),
+        distance_to_target,
+        days_to_expiry,
+        in_sweet_spot
+    )
+
+
+def calculate_opportunity_score_batch(
+    current_prob,
+    momentum,
+    hours_to_expiry,
+    volume,
+    best_bid,
+    best_ask,
+    direction,
+    one_day_change=0,
+    one_week_change=0,
+    annualized_yield=0,
+    charm=0
+) -> dict:
+    """
+    Vectorized version of calculate_opportunity_score.
     
-    # =================================================================
-    # 7. DYNAMIC WEIGHTING based on context
-    # Smooth transitions instead of hard cutoffs
-    # =================================================================
-    w_distance_time = 0.35
-    w_apy = 0.25
-    w_volume = 0.15
-    w_spread = 0.10
-    w_momentum = 0.10
-    w_charm = 0.05
-    
-    # Adjust weights based on time horizon (smooth sigmoid)
-    if days_to_expiry < 3:  # Very short-term
-        # Increase spread and charm importance
-        shift = min(0.08, (3 - days_to_expiry) / 10)
-        w_spread += shift / 2
-        w_charm += shift / 2
-        w_apy -= shift
-    elif days_to_expiry > 14:  # Long-term
-        # Increase volume importance
-        shift = min(0.08, (days_to_expiry - 14) / 30)
-        w_volume += shift
-        w_distance_time -= shift
-    
-    # Adjust based on distance from sweet spot (polynomial)
-    distance_from_sweet_spot = abs(distance_to_target - optimal_distance) / optimal_distance
-    if distance_from_sweet_spot > 0.5:
-        # Far from sweet spot: APY matters more
-        shift = min(0.10, distance_from_sweet_spot * 0.15)
-        w_apy += shift
-        w_distance_time -= shift
+    Every parameter may be a scalar or an array; inputs are broadcast
+    together and all scenarios are scored in one call: a parallel loop
+    over the compiled scoring core when Numba is installed, otherwise
+    one NumPy pass. Missing bid/ask quotes are given as NaN instead of
+    None.
     
-    # =================================================================
-    # 8. FINAL SCORE - Weighted combination
-    # No hard penalties, all handled by smooth component scores
-    # =================================================================
-    raw_score = (
-        distance_time_score * w_distance_time +
-        apy_score * w_apy +
-        volume_score * w_volume +
-        spread_score * w_spread +
-        momentum_score * w_momentum +
-        charm_score * w_charm
+    Returns a dict keyed by the ScoreResult field names, with arrays
+    as values (components is a dict of arrays).
+    """
+    (current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+     one_day_change, one_week_change, annualized_yield, charm) = (
+        np.asarray(x, dtype=float) for x in (
+            current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+            one_day_change, one_week_change, annualized_yield, charm
+        )
     )
-    
-    # Apply counter-trend risk penalty if momentum is misaligned
-    # This creates additional ~5% penalty beyond the momentum component reduction
-    if is_counter_trend:
-        risk_penalty = 0.95  # 5% overall reduction for counter-trend setups
+    direction = np.asarray(direction)
+    (current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+     direction, one_day_change, one_week_change, annualized_yield, charm) = np.broadcast_arrays(
+        current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+        direction, one_day_change, one_week_change, annualized_yield, charm
+    )
+    is_yes = direction == 'YES'
+    is_no = direction == 'NO'
+    
+    if HAS_NUMBA:
+        # Compiled loop over the scalar core, spread across CPU cores
+        scores = np.empty((current_prob.size, 10))
+        score_batch(
+            *(np.ascontiguousarray(x).ravel() for x in (
+                current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+                is_yes, is_no, one_day_change, one_week_change, annualized_yield, charm
+            )),
+            scores
+        )
+        (final_score, distance_time_score, apy_score, volume_score, spread_score,
+         momentum_score, charm_score, distance_to_target, days_to_expiry,
+         in_sweet_spot) = scores.T.reshape((10,) + current_prob.shape)
+        in_sweet_spot = in_sweet_spot.astype(bool)
     else:
-        risk_penalty = 1.0
-    
-    final_score = min(100, max(0, raw_score * risk_penalty))
+        (final_score, distance_time_score, apy_score, volume_score, spread_score,
+         momentum_score, charm_score, distance_to_target, days_to_expiry,
+         in_sweet_spot) = score_arrays(
+            current_prob, momentum, hours_to_expiry, volume, best_bid, best_ask,
+            is_yes, is_no, one_day_change, one_week_change, annualized_yield, charm
+        )
     
-    # =================================================================
-    # 9. GRADE based on final score
-    # =================================================================
-    if final_score >= 85:
-        grade, grade_color = "A+", "#27ae60"
-    elif final_score >= 75:
-        grade, grade_color = "A", "#2ecc71"
-    elif final_score >= 65:
-        grade, grade_color = "B+", "#f1c40f"
-    elif final_score >= 55:
-        grade, grade_color = "B", "#f39c12"
-    elif final_score >= 45:
-        grade, grade_color = "C+", "#e67e22"
-    elif final_score >= 35:
-        grade, grade_color = "C", "#e74c3c"
-    else:
-        grade, grade_color = "D", "#c0392b"
+    # 9. GRADE (a NaN score fails every cut-off and falls to the last band,
+    # as in the scalar loop)
+    band = np.select(
+        [final_score >= min_score for min_score, _, _ in _GRADE_BANDS],
+        np.arange(len(_GRADE_BANDS)),
+        default=len(_GRADE_BANDS) - 1
+    )
+    grade = np.array([g for _, g, _ in _GRADE_BANDS])[band]
+    grade_color = np.array([c for _, _, c in _GRADE_BANDS])[band]
     
     return {
         'total_score': final_score,
@@ -1246,6 +1223,32 @@ def calculate_opportunity_score(
     }
 
 
+def split_opportunity_scores(batch: dict) -> List[ScoreResult]:
+    """
+    Split a calculate_opportunity_score_batch result into per-scenario
+    ScoreResults, as calculate_opportunity_score returns.
+    
+    An all-scalar batch (0-d arrays) splits into a single result.
+    """
+    (total_score, grade, grade_color, distance_to_target, days_to_expiry, in_sweet_spot) = (
+        np.atleast_1d(batch[key]) for key in (
+            'total_score', 'grade', 'grade_color', 'distance_to_target', 'days_to_expiry', 'in_sweet_spot'
+        )
+    )
+    components = [np.atleast_1d(batch['components'][name]) for name in ScoreComponents._fields]
+    return [
+        ScoreResult(
+            float(total_score[i]),
+            str(grade[i]),
+            str(grade_color[i]),
+            ScoreComponents(*(float(values[i]) for values in components)),
+            float(distance_to_target[i]),
+            float(days_to_expiry[i]),
+            bool(in_sweet_spot[i])
+        )
+        for i in range(len(total_score))
+    ]
+
 def render_pullback_hunter():
     """Render the Pullback Hunter dashboard page."""
     
@@ -1899,8 +1902,8 @@ def scan_pullback_markets(
                             'volume_24h': volume,
                             'momentum': momentum,
                             'charm': charm,
-                            'score': score_data['total_score'],
-                            'grade': score_data['grade'],
+                            'score': score_data.total_score,
+                            'grade': score_data.grade,
                             'direction': direction,
                             'annualized_yield': annualized_yield,
                             'best_bid': best_bid,
@@ -2059,8 +2062,8 @@ def scan_pullback_markets(
                         'volume_24h': volume,
                         'momentum': momentum,
                         'charm': charm,
-                        'score': score_data['total_score'],
-                        'grade': score_data['grade'],
+                        'score': score_data.total_score,
+                        'grade': score_data.grade,
                         'direction': direction,
                         'annualized_yield': annualized_yield,
                         'best_bid': best_bid,
@@ -0,0 +1,128 @@
+"""
+Ahead-of-time build of the opportunity scoring core.
+
+Compiles algorithms/opportunity_core.py:score_core into a native
+extension that app.py imports when present, so the dashboard skips the
+Numba JIT warm-up on every cold start. Without an extension it falls
+back to JIT compilation, or plain Python when Numba isn't installed.
+
+Backends:
+    numba   numba.pycc AOT -> algorithms/_opportunity_core_aot (default)
+    cython  Cython build   -> algorithms/_opportunity_core_cy, for
+            deployments that want a static module without Numba/LLVM
+
+Usage:
+    python build_scoring_ext.py [--backend numba|cython]
+
+Rebuild after changing opportunity_core.py; the extension is platform
+and Python-version specific and is not committed. Each build embeds
+opportunity_core.source_hash(), and app.py ignores an extension whose
+hash no longer matches the source.
+"""
+
+import argparse
+import inspect
+import os
+import sys
+import tempfile
+
+from algorithms.opportunity_core import (
+    score_core, source_hash, SCORE_CORE_SIGNATURE, VOLUME_MIDPOINT, VOLUME_EXPONENT
+)
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'algorithms')
+
+# Typed module header for the Cython backend; the body of score_core is
+# reused verbatim, with math.* calls mapped to libc
+CYTHON_HEADER = '''\
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, cpow=True, infer_types=True
+# Generated by build_scoring_ext.py from algorithms/opportunity_core.py; do not edit.
+from libc.math cimport exp, log10
+
+cdef double VOLUME_MIDPOINT = {volume_midpoint!r}
+cdef double VOLUME_EXPONENT = {volume_exponent!r}
+cdef long long SOURCE_HASH = {source_hash!r}
+
+
+cpdef long long source_hash():
+    return SOURCE_HASH
+
+
+cpdef tuple score_core(
+    double current_prob, double momentum, double hours_to_expiry, double volume,
+    double best_bid, double best_ask, bint is_yes, bint is_no,
+    double one_day_change, double one_week_change, double annualized_yield, double charm
+):
+'''
+
+
+def _python_score_core():
+    """The plain Python score_core, not the JIT dispatcher wrapping it."""
+    return getattr(score_core, 'py_func', score_core)
+
+
+def build_numba():
+    """Compile score_core with numba.pycc."""
+    from numba.pycc import CC
+
+    built_hash = source_hash()
+
+    def built_source_hash():
+        return built_hash
+
+    cc = CC('_opportunity_core_aot')
+    cc.output_dir = OUTPUT_DIR
+    cc.export('score_core', SCORE_CORE_SIGNATURE)(_python_score_core())
+    cc.export('source_hash', 'i8()')(built_source_hash)
+    cc.compile()
+
+
+def cython_source() -> str:
+    """Generate the Cython module source from score_core."""
+    source = inspect.getsource(_python_score_core())
+    body = source[source.index('\n):\n') + len('\n):\n'):]
+    body = body.replace('math.exp(', 'exp(').replace('math.log10(', 'log10(')
+    header = CYTHON_HEADER.format(
+        volume_midpoint=VOLUME_MIDPOINT, volume_exponent=VOLUME_EXPONENT, source_hash=source_hash()
+    )
+    return header + body
+
+
+def build_cython():
+    """Compile a typed copy of score_core with Cython."""
+    from Cython.Build import cythonize
+    from setuptools import Distribution, Extension
+
+    with tempfile.TemporaryDirectory() as build_dir:
+        pyx_path = os.path.join(build_dir, '_opportunity_core_cy.pyx')
+        with open(pyx_path, 'w', encoding='utf-8') as f:
+            f.write(cython_source())
+
+        extensions = cythonize([Extension('_opportunity_core_cy', [pyx_path])], quiet=True)
+        dist = Distribution({'ext_modules': extensions})
+        build_ext = dist.get_command_obj('build_ext')
+        build_ext.build_lib = OUTPUT_DIR
+        build_ext.build_temp = build_dir
+        dist.run_command('build_ext')
+
+
+BACKENDS = {
+    'numba': build_numba,
+    'cython': build_cython,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the opportunity scoring core ahead of time")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="numba",
+                        help="Compiler to build the extension with (default: numba)")
+    args = parser.parse_args()
+
+    print(f"Compiling score_core with {args.backend} into {OUTPUT_DIR}...")
+    BACKENDS[args.backend]()
+    print("Done. app.py will use the compiled scoring core on next start.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
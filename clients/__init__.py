@@ -2,7 +2,7 @@
 Polymarket API clients package.
 """
 
-from .gamma_client import GammaClient, GammaClientSync
+from .gamma_client import GammaClient, GammaClientSync, Market
 from .trades_client import TradesClient, TradesClientSync
 from .realtime_ws import RealtimeWebSocket, PriceTracker
 from .leaderboard_client import LeaderboardClient
@@ -10,6 +10,7 @@ from .leaderboard_client import LeaderboardClient
 __all__ = [
     'GammaClient',
     'GammaClientSync',
+    'Market',
     'TradesClient',
     'TradesClientSync',
     'RealtimeWebSocket',
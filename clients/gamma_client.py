@@ -5,7 +5,10 @@ Handles market discovery, filtering, and metadata retrieval.
 
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional, Any
+import codecs
+import json
+import time
+from typing import AsyncIterator, Dict, List, Optional, Any, NamedTuple
 from datetime import datetime
 import logging
 
@@ -13,11 +16,49 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class Market(NamedTuple):
+    """Lightweight, immutable view of the market fields scripts read most."""
+    
+    slug: str = ""
+    question: str = ""
+    outcomes: Any = ()
+    outcomePrices: Any = ()
+    bestBid: Optional[float] = None
+    bestAsk: Optional[float] = None
+    volume: Optional[Any] = None
+    liquidity: Optional[Any] = None
+    oneDayPriceChange: Optional[float] = None
+    oneWeekPriceChange: Optional[float] = None
+    
+    @classmethod
+    def from_api(cls, raw: Dict) -> "Market":
+        """Build a Market from a (normalized) API market dictionary."""
+        return cls(*(
+            default if raw.get(name) is None else raw[name]
+            for name, default in cls._field_defaults.items()
+        ))
+
+
 class GammaClient:
     """Client for Polymarket Gamma API - Core Market Data."""
     
     BASE_URL = "https://gamma-api.polymarket.com"
     
+    # Connection pool settings (shared keep-alive connections)
+    MAX_CONNECTIONS = 25
+    MAX_PER_HOST = 10
+    KEEPALIVE_TIMEOUT = 60
+    
+    # Market fields the API returns as JSON-encoded strings
+    JSON_LIST_FIELDS = ("outcomes", "outcomePrices")
+    
+    # Bytes read per chunk when streaming large responses
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # get_markets response cache (seconds to live, max distinct queries)
+    CACHE_TTL = 300
+    CACHE_MAXSIZE = 128
+    
     def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the Gamma API client.
@@ -27,15 +68,23 @@ class GammaClient:
         """
         self.session = session
         self._own_session = session is None
+        # Query params -> (expiry time, markets)
+        self._cache: Dict[tuple, tuple] = {}
         
     async def __aenter__(self):
         """Async context manager entry."""
         if self._own_session:
-            # Disable auto-decompression to avoid Brotli issues with large responses
-            connector = aiohttp.TCPConnector(limit=100)
+            # Keep-alive pool so repeated requests reuse one TCP/TLS connection
+            connector = aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS,
+                limit_per_host=self.MAX_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+            )
+            # Compressed responses, but no Brotli (issues with large responses)
             self.session = aiohttp.ClientSession(
                 connector=connector,
-                headers={'Accept-Encoding': 'gzip, deflate'}  # Disable Brotli
+                headers={'Accept-Encoding': 'gzip, deflate'}
             )
         return self
         
@@ -70,6 +119,50 @@ class GammaClient:
             logger.error(f"API request failed: {e}")
             raise
             
+    @classmethod
+    def _normalize_market(cls, market: Any) -> Any:
+        """
+        Decode JSON-encoded list fields in place.
+        
+        Only fields that are present are decoded; missing ones stay missing
+        so callers can still tell them apart. Non-dict responses are
+        returned unchanged.
+        
+        Args:
+            market: Raw market dictionary from the API
+            
+        Returns:
+            The same market dictionary with list fields decoded
+        """
+        if not isinstance(market, dict):
+            return market
+        for key in cls.JSON_LIST_FIELDS:
+            value = market.get(key)
+            if isinstance(value, str):
+                try:
+                    market[key] = json.loads(value)
+                except ValueError:
+                    pass  # Leave malformed values for the caller to handle
+        return market
+        
+    @classmethod
+    def _normalize_events(cls, events: Any) -> Any:
+        """
+        Normalize the markets nested inside an /events response.
+        
+        Args:
+            events: Raw list of event dictionaries from the API
+            
+        Returns:
+            The same events with their markets' list fields decoded
+        """
+        if isinstance(events, list):
+            for event in events:
+                if isinstance(event, dict) and isinstance(event.get("markets"), list):
+                    for market in event["markets"]:
+                        cls._normalize_market(market)
+        return events
+        
     async def get_markets(
         self,
         limit: int = 50,
@@ -91,8 +184,114 @@ class GammaClient:
             order_by: Sort field (volume24hr, liquidity, etc.)
             
         Returns:
-            List of market dictionaries
+            List of market dictionaries. Results are cached for CACHE_TTL
+            seconds. The call that fetches a result gets the cached dicts
+            themselves; calls served from the cache get their own copies,
+            so setting keys on those doesn't leak into the cache (nested
+            lists are shared and should be treated as read-only).
+        """
+        params = self._market_params(limit, offset, active, closed, category, order_by)
+        key = tuple(sorted(params.items()))
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            logger.debug(f"Using cached markets for params: {params}")
+            return [dict(m) for m in cached[1]]
+        
+        logger.info(f"Fetching markets with params: {params}")
+        markets = await self._request("/markets", params)
+        markets = [self._normalize_market(m) for m in markets]
+        self._store_cached(key, tuple(markets), now)
+        return markets
+        
+    def _store_cached(self, key: tuple, markets: tuple, now: float):
+        """Cache a get_markets result, evicting expired then oldest entries."""
+        if len(self._cache) >= self.CACHE_MAXSIZE:
+            for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                del self._cache[stale]
+            while len(self._cache) >= self.CACHE_MAXSIZE:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + self.CACHE_TTL, markets)
+        
+    def invalidate_cache(self):
+        """Drop cached get_markets results so the next call hits the API."""
+        self._cache.clear()
+        
+    async def iter_markets(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        category: Optional[str] = None,
+        order_by: str = "volume24hr"
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream markets one at a time while the response is still downloading.
+        
+        Only the current market is held in memory, and breaking out early
+        stops reading the socket. Close the generator (aclose) when
+        stopping early so the connection is released promptly.
+        
+        Args:
+            Same filters as get_markets
+            
+        Yields:
+            Normalized market dictionaries
         """
+        params = self._market_params(limit, offset, active, closed, category, order_by)
+        logger.info(f"Streaming markets with params: {params}")
+        url = f"{self.BASE_URL}/markets"
+        
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        json_decoder = json.JSONDecoder()
+        buffer = ""
+        in_array = False
+        
+        try:
+            async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                    buffer += text_decoder.decode(chunk)
+                    pos = 0
+                    while True:
+                        # Skip separators between array items
+                        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                            pos += 1
+                        if pos >= len(buffer):
+                            break
+                        if not in_array:
+                            if buffer[pos] != "[":
+                                raise ValueError(f"Expected a JSON array of markets, got {buffer[pos]!r}")
+                            in_array = True
+                            pos += 1
+                            continue
+                        if buffer[pos] == "]":
+                            return
+                        try:
+                            market, pos = json_decoder.raw_decode(buffer, pos)
+                        except json.JSONDecodeError:
+                            break  # Incomplete item, wait for more data
+                        yield self._normalize_market(market)
+                    buffer = buffer[pos:]
+            raise ValueError("Market stream ended before the closing bracket")
+        except aiohttp.ClientPayloadError as e:
+            logger.error(f"Payload error (possibly compression issue): {e}")
+            raise
+        except aiohttp.ClientError as e:
+            logger.error(f"API request failed: {e}")
+            raise
+            
+    @staticmethod
+    def _market_params(
+        limit: int,
+        offset: int,
+        active: Optional[bool],
+        closed: Optional[bool],
+        category: Optional[str],
+        order_by: str
+    ) -> Dict:
+        """Build query parameters for the /markets endpoint."""
         params = {
             "limit": limit,
             "offset": offset,
@@ -106,8 +305,7 @@ class GammaClient:
         if category:
             params["tag"] = category
             
-        logger.info(f"Fetching markets with params: {params}")
-        return await self._request("/markets", params)
+        return params
         
     async def get_breaking_markets(self, limit: int = 50) -> List[Dict]:
         """
@@ -128,7 +326,7 @@ class GammaClient:
         logger.info(f"Fetching breaking markets with limit: {limit}")
         try:
             # Try the events endpoint which often has breaking news
-            return await self._request("/events", params)
+            return self._normalize_events(await self._request("/events", params))
         except Exception as e:
             logger.warning(f"Failed to fetch breaking markets: {e}")
             # Fallback to regular markets sorted by volume
@@ -145,7 +343,7 @@ class GammaClient:
             Market data dictionary
         """
         logger.info(f"Fetching market ID: {market_id}")
-        return await self._request(f"/markets/{market_id}")
+        return self._normalize_market(await self._request(f"/markets/{market_id}"))
         
     async def get_market_by_slug(self, slug: str) -> Dict:
         """
@@ -158,7 +356,7 @@ class GammaClient:
             Market data dictionary
         """
         logger.info(f"Fetching market slug: {slug}")
-        return await self._request(f"/markets/slug/{slug}")
+        return self._normalize_market(await self._request(f"/markets/slug/{slug}"))
         
     async def get_events(
         self,
@@ -186,7 +384,7 @@ class GammaClient:
             params["archived"] = str(archived).lower()
             
         logger.info(f"Fetching events with params: {params}")
-        return await self._request("/events", params)
+        return self._normalize_events(await self._request("/events", params))
         
     async def get_tags(self) -> List[Dict]:
         """
@@ -11,6 +11,11 @@ import sys
 
 from colorama import Fore, Back, Style, init
 
+try:
+    import uvloop  # optional faster event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
 from clients.trades_client import TradesClient
 from utils.user_tracker import get_user_tracker
 from utils.helpers import format_currency
@@ -178,4 +183,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(main())
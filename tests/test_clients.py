@@ -6,7 +6,7 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from urllib.parse import urlparse
-from clients.gamma_client import GammaClient
+from clients.gamma_client import GammaClient, Market
 from clients.trades_client import TradesClient
 from clients.leaderboard_client import LeaderboardClient
 
@@ -27,6 +27,135 @@ class TestGammaClient:
         assert client.session == "mock_session"
         assert client._own_session is False
 
+    def test_owned_session_uses_keepalive_pool(self):
+        """Test owned session is configured for connection reuse."""
+        async def open_session():
+            async with GammaClient() as client:
+                connector = client.session.connector
+                return connector.limit, connector.limit_per_host
+
+        limit, limit_per_host = asyncio.run(open_session())
+        assert limit == GammaClient.MAX_CONNECTIONS
+        assert limit_per_host == GammaClient.MAX_PER_HOST
+
+    def test_normalize_market_decodes_list_fields(self):
+        """Test JSON-encoded outcomes/prices are decoded at the client boundary."""
+        market = GammaClient._normalize_market({
+            'slug': 'm1',
+            'outcomes': '["Yes", "No"]',
+            'outcomePrices': '["0.06", "0.94"]'
+        })
+        assert market['outcomes'] == ['Yes', 'No']
+        assert market['outcomePrices'] == ['0.06', '0.94']
+
+        # Already-decoded and malformed values
+        market = GammaClient._normalize_market({'outcomes': ['Yes', 'No'], 'outcomePrices': 'Yes, No'})
+        assert market['outcomes'] == ['Yes', 'No']
+        assert market['outcomePrices'] == 'Yes, No'
+
+        # Missing fields stay missing so callers' defaults still apply
+        assert 'outcomePrices' not in GammaClient._normalize_market({'slug': 'm2'})
+
+        # Non-dict responses pass through untouched
+        assert GammaClient._normalize_market(None) is None
+        assert GammaClient._normalize_market([]) == []
+
+    def test_get_events_normalizes_nested_markets(self):
+        """Test markets nested in /events responses are decoded too."""
+        async def fetch():
+            client = GammaClient(session=MagicMock())
+            client._request = AsyncMock(return_value=[
+                {'slug': 'e1', 'markets': [{'slug': 'm1', 'outcomePrices': '["0.4", "0.6"]'}]},
+                {'slug': 'e2'}
+            ])
+            return await client.get_events(limit=2)
+
+        events = asyncio.run(fetch())
+        assert events[0]['markets'][0]['outcomePrices'] == ['0.4', '0.6']
+        assert 'markets' not in events[1]
+
+    def test_market_record_from_api(self):
+        """Test Market records keep the read fields and default missing ones."""
+        market = Market.from_api({
+            'slug': 'cardano-etf-in-2025',
+            'question': None,
+            'outcomes': ['Yes', 'No'],
+            'bestBid': 0.05,
+            'endDate': '2025-12-31'
+        })
+        assert market.slug == 'cardano-etf-in-2025'
+        assert market.question == ''
+        assert market.outcomes == ['Yes', 'No']
+        assert market.bestBid == 0.05
+        assert market.bestAsk is None
+        assert 'endDate' not in market._asdict()
+
+    def test_iter_markets_streams_chunked_array(self):
+        """Test markets are decoded incrementally across arbitrary chunk boundaries."""
+        body = (
+            '[{"slug": "a", "question": "Café?", "outcomes": "[\\"Yes\\", \\"No\\"]"},\n'
+            ' {"slug": "b", "question": "B?"}]'
+        ).encode('utf-8')
+
+        async def iter_chunked(size):
+            for i in range(0, len(body), 7):  # Splits objects and the UTF-8 "é"
+                yield body[i:i + 7]
+
+        response = MagicMock()
+        response.content.iter_chunked = iter_chunked
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.get.return_value = request
+
+        async def collect():
+            client = GammaClient(session=session)
+            return [m async for m in client.iter_markets(limit=2)]
+
+        markets = asyncio.run(collect())
+        assert [m['slug'] for m in markets] == ['a', 'b']
+        assert markets[0]['question'] == 'Café?'
+        assert markets[0]['outcomes'] == ['Yes', 'No']
+        assert 'outcomes' not in markets[1]
+
+    def test_get_markets_cached_until_invalidated(self):
+        """Test repeated get_markets queries are served from the TTL cache."""
+        async def fetch():
+            client = GammaClient(session=MagicMock())
+            client._request = AsyncMock(return_value=[{'slug': 'a', 'outcomes': '["Yes", "No"]'}])
+            first = await client.get_markets(limit=10, order_by='volume')
+            second = await client.get_markets(limit=10, order_by='volume')
+            await client.get_markets(limit=10, order_by='liquidity')
+            calls_before_invalidate = client._request.await_count
+            client.invalidate_cache()
+            await client.get_markets(limit=10, order_by='volume')
+            return first, second, calls_before_invalidate, client._request.await_count
+
+        first, second, calls_before_invalidate, calls = asyncio.run(fetch())
+        assert first == second == [{'slug': 'a', 'outcomes': ['Yes', 'No']}]
+        assert first is not second
+        assert calls_before_invalidate == 2
+        assert calls == 3
+
+    def test_cached_markets_not_shared_between_callers(self):
+        """Test mutating a cache-served get_markets result doesn't change later results."""
+        async def fetch():
+            client = GammaClient(session=MagicMock())
+            client._request = AsyncMock(return_value=[{'slug': 'a', 'volume': 10}])
+            first = await client.get_markets(limit=10)
+            first.append({'slug': 'extra'})
+            second = await client.get_markets(limit=10)
+            second[0]['volume'] = 0
+            second[0]['_validated_outcomes'] = ['Yes', 'No']
+            third = await client.get_markets(limit=10)
+            return second, third, client._request.await_count
+
+        second, third, calls = asyncio.run(fetch())
+        assert second[0] is not third[0]
+        assert third == [{'slug': 'a', 'volume': 10}]
+        assert calls == 1
+
 
 class TestTradesClient:
     """Test suite for TradesClient."""
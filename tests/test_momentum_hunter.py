@@ -138,7 +138,7 @@ class TestMomentumHunter:
     
     def test_score_calculation(self):
         """Test multi-modal scoring system with sweet spot optimization."""
-        from app import calculate_opportunity_score
+        from app import calculate_opportunity_score, ScoreResult
         
         # Test case: Sweet spot - 3.5% distance, 8.5 days
         score_data = calculate_opportunity_score(
@@ -156,29 +156,217 @@ class TestMomentumHunter:
         )
         
         # Verify structure
-        assert 'total_score' in score_data
-        assert 'grade' in score_data
-        assert 'components' in score_data
-        assert 'in_sweet_spot' in score_data
+        assert isinstance(score_data, ScoreResult)
         
         # Verify components exist
-        components = score_data['components']
-        assert 'distance_time_fit' in components
-        assert 'apy' in components
-        assert 'volume' in components
-        assert 'spread' in components
-        assert 'momentum' in components
-        assert 'charm' in components
+        components = score_data.components
+        assert components._fields == (
+            'distance_time_fit', 'apy', 'volume', 'spread', 'momentum', 'charm'
+        )
         
         # All scores should be valid (0-100)
-        for key, value in components.items():
+        for key, value in components._asdict().items():
             assert 0 <= value <= 100, f"{key} score {value} out of range"
         
-        assert 0 <= score_data['total_score'] <= 100
+        assert 0 <= score_data.total_score <= 100
         
         # Sweet spot should be detected
-        assert score_data['in_sweet_spot'] == True
-    
+        assert score_data.in_sweet_spot == True
+
+    def test_score_calculation_is_memoized(self):
+        """Test repeated scoring hits the cache and returns an immutable result."""
+        from app import calculate_opportunity_score, _score_cached
+
+        params = {
+            'current_prob': 0.965,
+            'momentum': 0.35,
+            'hours_to_expiry': 8.5 * 24,
+            'volume': 1_000_000,
+            'best_bid': 0.96,
+            'best_ask': 0.97,
+            'direction': 'YES',
+        }
+        _score_cached.cache_clear()
+
+        first = calculate_opportunity_score(**params)
+        with pytest.raises(AttributeError):
+            first.components.apy = -1  # The cached entry can't be mutated by a caller
+        second = calculate_opportunity_score(**params)
+
+        assert _score_cached.cache_info().hits == 1
+        assert second == first
+
+    def test_batch_score_matches_scalar(self):
+        """Test vectorized scoring agrees with the scalar scoring function."""
+        import numpy as np
+        from app import (
+            calculate_opportunity_score,
+            calculate_opportunity_score_batch,
+            split_opportunity_scores,
+        )
+
+        rng = np.random.default_rng(7)
+        n = 200
+        batch_params = {
+            'current_prob': rng.uniform(0.0, 1.0, n),
+            'momentum': rng.uniform(0.0, 1.0, n),
+            'hours_to_expiry': rng.uniform(1, 90 * 24, n),
+            'volume': rng.choice([0, 50_000, 500_000, 3_000_000, 20_000_000], n),
+            'best_bid': rng.uniform(0.0, 1.0, n),
+            'best_ask': rng.uniform(0.0, 1.0, n),
+            'direction': rng.choice(['YES', 'NO'], n),
+            'one_day_change': rng.uniform(-0.2, 0.2, n),
+            'one_week_change': rng.uniform(-0.2, 0.2, n),
+            'annualized_yield': rng.choice([0, 0.3, 0.8, 3.0, 7.0, 50.0], n),
+            'charm': rng.uniform(-40, 40, n)
+        }
+
+        batch_results = split_opportunity_scores(calculate_opportunity_score_batch(**batch_params))
+        assert len(batch_results) == n
+
+        for i, batch_result in enumerate(batch_results):
+            params = {key: values[i].item() for key, values in batch_params.items()}
+            expected = calculate_opportunity_score(**params)
+
+            assert batch_result.total_score == pytest.approx(expected.total_score)
+            assert batch_result.grade == expected.grade
+            assert batch_result.in_sweet_spot == expected.in_sweet_spot
+            for name, value in expected.components._asdict().items():
+                assert getattr(batch_result.components, name) == pytest.approx(value)
+
+    def test_batch_score_accepts_all_scalar_inputs(self):
+        """Test an all-scalar batch splits into one result matching the scalar call."""
+        from app import (
+            calculate_opportunity_score,
+            calculate_opportunity_score_batch,
+            split_opportunity_scores,
+        )
+
+        params = {
+            'current_prob': 0.965,
+            'momentum': 0.30,
+            'hours_to_expiry': 8 * 24,
+            'volume': 1_000_000,
+            'best_bid': 0.96,
+            'best_ask': 0.97,
+            'direction': 'YES',
+        }
+        results = split_opportunity_scores(calculate_opportunity_score_batch(**params))
+
+        assert len(results) == 1
+        expected = calculate_opportunity_score(**params)
+        assert results[0].total_score == pytest.approx(expected.total_score)
+        assert results[0].grade == expected.grade
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_batch_grades_nan_inputs_like_scalar(self, use_numba):
+        """Test NaN inputs get the same grade from the batch path (Numba or NumPy) as the scalar path."""
+        import app
+        from app import (
+            calculate_opportunity_score,
+            calculate_opportunity_score_batch,
+            split_opportunity_scores,
+        )
+
+        if use_numba and not app.HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        base = {
+            'current_prob': 0.965,
+            'momentum': 0.30,
+            'hours_to_expiry': 8 * 24,
+            'volume': 1_000_000,
+            'best_bid': 0.96,
+            'best_ask': 0.97,
+            'direction': 'YES',
+        }
+        for key in ('volume', 'current_prob'):
+            params = dict(base, **{key: float('nan')})
+            expected = calculate_opportunity_score(**params)
+            with patch.object(app, 'HAS_NUMBA', use_numba):
+                result, = split_opportunity_scores(calculate_opportunity_score_batch(**params))
+
+            assert result.grade == expected.grade
+            assert result.total_score == pytest.approx(expected.total_score)
+
+    def test_compiled_score_core_matches_python(self):
+        """Test the compiled scoring core (JIT/AOT when available) matches plain Python."""
+        from app import _score_core
+        from algorithms.opportunity_core import score_core
+
+        for args in [
+            (0.965, 0.30, 204.0, 1e6, 0.96, 0.97, True, False, 0.05, 0.10, 3.0, 6.0),
+            (0.02, 0.50, 12.0, 0.0, 0.0, 0.0, False, True, -0.05, 0.10, 50.0, 25.0),
+        ]:
+            compiled = _score_core(*args)
+            expected = getattr(score_core, 'py_func', score_core)(*args)
+            assert compiled[:-1] == pytest.approx(expected[:-1])
+            assert compiled[-1] == expected[-1]
+
+    def test_score_arrays_matches_python_score_core(self):
+        """Test the NumPy scoring pass matches plain-Python score_core, with or without Numba."""
+        import numpy as np
+        from algorithms.opportunity_core import score_arrays, score_core
+
+        rng = np.random.default_rng(11)
+        n = 300
+        is_yes = rng.random(n) < 0.5
+        args = (
+            rng.uniform(0.0, 1.0, n),
+            rng.uniform(0.0, 1.0, n),
+            rng.uniform(1, 90 * 24, n),
+            rng.choice([0, 50_000, 500_000, 3_000_000, 20_000_000], n).astype(float),
+            rng.choice([0.0, 0.5, 0.96], n),
+            rng.choice([0.0, 0.55, 0.97], n),
+            is_yes,
+            ~is_yes,
+            rng.uniform(-0.2, 0.2, n),
+            rng.uniform(-0.2, 0.2, n),
+            rng.choice([0, 0.3, 0.8, 3.0, 7.0, 50.0], n),
+            rng.uniform(-40, 40, n),
+        )
+
+        arrays = score_arrays(*args)
+        python_core = getattr(score_core, 'py_func', score_core)
+        for i in range(n):
+            expected = python_core(*(value[i].item() for value in args))
+            assert [values[i] for values in arrays[:-1]] == pytest.approx(expected[:-1])
+            assert arrays[-1][i] == expected[-1]
+
+    def test_stale_compiled_score_core_is_ignored(self):
+        """Test an extension built from older score_core source falls back to the JIT core."""
+        import sys
+        import types
+        from app import _load_compiled_score_core, _COMPILED_SCORE_CORES
+        from algorithms.opportunity_core import source_hash
+
+        aot_name, cy_name = _COMPILED_SCORE_CORES
+        stale = types.SimpleNamespace(source_hash=lambda: source_hash() + 1, score_core='stale')
+        current = types.SimpleNamespace(source_hash=source_hash, score_core='current')
+
+        with patch.dict(sys.modules, {aot_name: stale, cy_name: current}):
+            assert _load_compiled_score_core() == 'current'
+        with patch.dict(sys.modules, {aot_name: stale, cy_name: None}):
+            assert _load_compiled_score_core() is None
+
+    def test_score_inputs_matches_keyword_call(self):
+        """Test scoring a ScoringInputs bundle matches the keyword call."""
+        from app import calculate_opportunity_score, score_inputs, ScoringInputs
+
+        params = {
+            'current_prob': 0.965,
+            'momentum': 0.30,
+            'hours_to_expiry': 8.5 * 24,
+            'volume': 1_000_000,
+            'best_bid': None,
+            'best_ask': None,
+            'direction': 'YES',
+            'charm': 6.0
+        }
+        inputs = ScoringInputs(**params)
+        assert inputs.one_day_change == 0
+        assert score_inputs(inputs) == calculate_opportunity_score(**params)
+
     def test_expiration_filtering(self):
         """Test that markets are filtered by expiration correctly."""
         now = datetime.now(timezone.utc)
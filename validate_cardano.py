@@ -1,83 +1,128 @@
 """
 Validation script to debug Cardano ETF market data from API feed
 """
+import argparse
 import asyncio
 import logging
-import json
-from clients.gamma_client import GammaClient
+import re
+from clients.gamma_client import GammaClient, Market
+
+try:
+    import uvloop  # optional faster event loop (not available on Windows)
+except ImportError:
+    uvloop = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Sort orders to search concurrently
+ORDERINGS = ["", "volume", "liquidity"]
+
+# Slugs we are looking for; checked before any text matching
+WATCHED_SLUGS = frozenset({"cardano-etf-in-2025"})
+
+# One pass finds every keyword of interest (word-bounded, so "Canada" isn't "ada")
+_CARDANO_RE = re.compile(r'cardano|\bada\b|\betf\b', re.IGNORECASE)
+
+
+def _match_cardano(market, watched_slugs=WATCHED_SLUGS):
+    """
+    Classify a market against the Cardano ETF search.
+    
+    Returns 'slug' (watched slug), 'keywords' (cardano + etf), 'candidate'
+    (mentions cardano/ada, reported if nothing matches) or None.
+    """
+    if market.slug in watched_slugs:
+        return 'slug'
+    
+    hits = {hit.lower() for hit in _CARDANO_RE.findall(f"{market.question} {market.slug}")}
+    if 'cardano' in hits and 'etf' in hits:
+        return 'keywords'
+    if 'cardano' in hits or 'ada' in hits:
+        return 'candidate'
+    return None
+
+
+async def _search_ordering(client, order_by, watched_slugs, seen, candidates):
+    """
+    Stream one sort order until the Cardano market shows up.
+    
+    Only the current market is kept in memory; slugs seen and loose
+    candidates are recorded for the not-found report. Markets already
+    checked by another sort order are skipped without text matching.
+    """
+    logger.info(f"Streaming with order_by='{order_by}'...")
+    stream = client.iter_markets(limit=1000, active=True, closed=False, order_by=order_by)
+    count = 0
+    try:
+        async for raw in stream:
+            market = Market.from_api(raw)
+            count += 1
+            if not market.slug or market.slug in seen:
+                continue
+            seen.add(market.slug)
+            
+            match = _match_cardano(market, watched_slugs)
+            if match == 'candidate':
+                candidates[market.slug] = market
+            elif match:
+                return market, match
+    except Exception as e:
+        logger.warning(f"  order_by='{order_by}' failed: {e}")
+    finally:
+        await stream.aclose()
+        logger.info(f"  order_by='{order_by}': scanned {count} markets")
+    return None
+
+
 async def validate_cardano_market():
     """Fetch and validate Cardano ETF market data"""
     
-    market_slug = "cardano-etf-in-2025"
-    
     async with GammaClient() as client:
-        logger.info(f"Fetching market: {market_slug}")
+        logger.info(f"Fetching market: {', '.join(sorted(WATCHED_SLUGS))}")
         logger.info("=" * 80)
         
-        # Try multiple search strategies
-        all_markets = []
-        
-        # Strategy 1: Fetch with different sorting
-        for order_by in ["", "volume", "liquidity"]:
-            try:
-                logger.info(f"Fetching with order_by='{order_by}'...")
-                markets = await client.get_markets(limit=1000, active=True, closed=False, order_by=order_by)
-                all_markets.extend(markets)
-                logger.info(f"  Got {len(markets)} markets")
-            except Exception as e:
-                logger.warning(f"  Failed: {e}")
-        
-        # Deduplicate
+        # Strategy 1: Stream several sort orders at once, stop at the first hit
         seen = set()
-        markets = []
-        for m in all_markets:
-            slug = m.get('slug', '')
-            if slug and slug not in seen:
-                seen.add(slug)
-                markets.append(m)
-        
-        logger.info(f"\nTotal unique markets: {len(markets)}")
-        
-        # Search for Cardano
-        cardano_market = None
-        for market in markets:
-            slug = market.get('slug', '')
-            question = market.get('question', '').lower()
-            
-            # Check slug match
-            if slug == market_slug or 'cardano' in slug.lower():
-                logger.info(f"✓ Found by slug: {slug}")
-                cardano_market = market
-                break
-            
-            # Check question match
-            if 'cardano' in question and 'etf' in question:
-                logger.info(f"✓ Found by question: {market.get('question')}")
-                logger.info(f"  Slug: {slug}")
-                cardano_market = market
-                break
+        candidates = {}
+        pending = {
+            asyncio.create_task(_search_ordering(client, order_by, WATCHED_SLUGS, seen, candidates))
+            for order_by in ORDERINGS
+        }
+        cardano_market, match = None, None
+        while pending and cardano_market is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                found = task.result()
+                if found and cardano_market is None:
+                    cardano_market, match = found
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        logger.info(f"\nTotal unique markets scanned: {len(seen)}")
         
         if not cardano_market:
             logger.error(f"❌ Market not found! Showing all markets with 'cardano' or 'ada':")
-            for market in markets:
-                question = market.get('question', '').lower()
-                slug = market.get('slug', '').lower()
-                if 'cardano' in question or 'cardano' in slug or 'ada' in question or ' ada ' in question:
-                    logger.info(f"  - {market.get('question')} | slug: {market.get('slug')}")
+            for market in candidates.values():
+                logger.info("  - %s | slug: %s", market.question, market.slug)
             
             logger.error("No Cardano ETF market found in any form!")
             return
         
-        # Print ALL fields
-        logger.info("\n" + "=" * 80)
-        logger.info("📊 FULL MARKET DATA")
-        logger.info("=" * 80)
-        for key, value in cardano_market.items():
-            logger.info(f"{key}: {value}")
+        if match == 'slug':
+            logger.info(f"✓ Found by slug: {cardano_market.slug}")
+        else:
+            logger.info(f"✓ Found by keywords: {cardano_market.question}")
+            logger.info(f"  Slug: {cardano_market.slug}")
+        
+        # Print ALL fields (--verbose only; %-style args are formatted lazily)
+        logger.debug("\n" + "=" * 80)
+        logger.debug("📊 FULL MARKET DATA")
+        logger.debug("=" * 80)
+        if logger.isEnabledFor(logging.DEBUG):
+            for key, value in cardano_market._asdict().items():
+                logger.debug("%s: %s", key, value)
         
         # Parse and validate key fields
         logger.info("\n" + "=" * 80)
@@ -85,46 +130,41 @@ async def validate_cardano_market():
         logger.info("=" * 80)
         
         # Question
-        question = cardano_market.get('question', 'Unknown')
+        question = cardano_market.question or 'Unknown'
         logger.info(f"Question: {question}")
         
         # Slug
-        slug = cardano_market.get('slug', '')
+        slug = cardano_market.slug
         logger.info(f"Slug: {slug}")
         
         # Outcomes
-        outcomes = cardano_market.get('outcomes', [])
-        if isinstance(outcomes, str):
-            outcomes = json.loads(outcomes)
-        logger.info(f"Outcomes (raw): {cardano_market.get('outcomes')}")
-        logger.info(f"Outcomes (parsed): {outcomes}")
+        # GammaClient already decodes the JSON-encoded list fields
+        outcomes = cardano_market.outcomes
+        logger.info(f"Outcomes: {outcomes}")
         logger.info(f"Number of outcomes: {len(outcomes)}")
         
         # Outcome Prices
-        outcome_prices = cardano_market.get('outcomePrices', [])
-        if isinstance(outcome_prices, str):
-            outcome_prices = json.loads(outcome_prices)
-        logger.info(f"OutcomePrices (raw): {cardano_market.get('outcomePrices')}")
-        logger.info(f"OutcomePrices (parsed): {outcome_prices}")
+        outcome_prices = cardano_market.outcomePrices
+        logger.info(f"OutcomePrices: {outcome_prices}")
         logger.info(f"Number of prices: {len(outcome_prices)}")
         
         # Bid/Ask
-        best_bid = cardano_market.get('bestBid')
-        best_ask = cardano_market.get('bestAsk')
+        best_bid = cardano_market.bestBid
+        best_ask = cardano_market.bestAsk
         logger.info(f"BestBid: {best_bid} (type: {type(best_bid)})")
         logger.info(f"BestAsk: {best_ask} (type: {type(best_ask)})")
         
         # Volume
-        volume = cardano_market.get('volume')
+        volume = cardano_market.volume
         logger.info(f"Volume: {volume}")
         
         # Liquidity
-        liquidity = cardano_market.get('liquidity')
+        liquidity = cardano_market.liquidity
         logger.info(f"Liquidity: {liquidity}")
         
         # Price changes
-        one_day_change = cardano_market.get('oneDayPriceChange')
-        one_week_change = cardano_market.get('oneWeekPriceChange')
+        one_day_change = cardano_market.oneDayPriceChange
+        one_week_change = cardano_market.oneWeekPriceChange
         logger.info(f"OneDayPriceChange: {one_day_change}")
         logger.info(f"OneWeekPriceChange: {one_week_change}")
         
@@ -179,4 +219,11 @@ async def validate_cardano_market():
         logger.info("\n" + "=" * 80)
 
 if __name__ == "__main__":
-    asyncio.run(validate_cardano_market())
+    parser = argparse.ArgumentParser(description="Debug Cardano ETF market data from the Gamma API")
+    parser.add_argument("--verbose", action="store_true", help="Also dump every field of the matched market")
+    args = parser.parse_args()
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(validate_cardano_market())
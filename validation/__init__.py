@@ -0,0 +1,3 @@
+"""
+Scoring validation scripts for the Momentum Hunter opportunity scorer.
+"""
@@ -3,36 +3,45 @@ Practical scenario validation examples.
 
 This script demonstrates how the scoring system evaluates
 real-world market situations with practical interpretations.
+
+Run from the repository root:
+    python -m validation.practical_scenarios
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import calculate_opportunity_score
+import numpy as np
+
+from app import calculate_opportunity_score_batch, split_opportunity_scores
+
+# Component score bars, indexed by int(score / 5)
+_BARS = tuple(('█' * i + '░' * (20 - i)) for i in range(21))
 
 
 def print_scenario(title, description, result, params):
     """Print formatted scenario analysis."""
-    print(f"\n{'='*80}")
-    print(f"{title}")
-    print(f"{'='*80}")
-    print(f"{description}")
-    print(f"\nMarket Setup:")
-    print(f"  Probability: {params['current_prob']:.1%} ({params['direction']})")
-    print(f"  Distance to extreme: {result['distance_to_target']*100:.2f}%")
-    print(f"  Days to expiry: {result['days_to_expiry']:.1f}")
-    print(f"  Volume: ${params['volume']:,.0f}")
-    print(f"  Bid/Ask: {params['best_bid']:.3f} / {params['best_ask']:.3f}")
-    print(f"  APY: {params['annualized_yield']:.1f}%")
-    
-    print(f"\nSCORE: {result['total_score']:.1f}/100 | Grade: {result['grade']}")
-    print(f"   Sweet Spot: {'YES' if result['in_sweet_spot'] else 'NO'}")
+    lines = [
+        f"\n{'='*80}",
+        f"{title}",
+        f"{'='*80}",
+        f"{description}",
+        f"\nMarket Setup:",
+        f"  Probability: {params['current_prob']:.1%} ({params['direction']})",
+        f"  Distance to extreme: {result.distance_to_target*100:.2f}%",
+        f"  Days to expiry: {result.days_to_expiry:.1f}",
+        f"  Volume: ${params['volume']:,.0f}",
+        f"  Bid/Ask: {params['best_bid']:.3f} / {params['best_ask']:.3f}",
+        f"  APY: {params['annualized_yield']:.1f}%",
+        f"\nSCORE: {result.total_score:.1f}/100 | Grade: {result.grade}",
+        f"   Sweet Spot: {'YES' if result.in_sweet_spot else 'NO'}",
+        f"\n   Component Scores:",
+    ]
+    for comp, score in result.components._asdict().items():
+        bars = _BARS[min(20, max(0, int(score/5)))]
+        lines.append(f"   {comp:20s} [{bars}] {score:5.1f}")
     
-    print(f"\n   Component Scores:")
-    for comp, score in result['components'].items():
-        bars = '█' * int(score/5) + '░' * (20 - int(score/5))
-        print(f"   {comp:20s} [{bars}] {score:5.1f}")
+    # Emit the whole block with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
     
 
 def main():
@@ -42,6 +51,8 @@ def main():
     print("\nReal-world examples showing how the scoring system evaluates")
     print("different market opportunities with practical interpretations.\n")
     
+    scenarios = []
+    
     # Scenario 1: The Ideal Trade
     params1 = {
         'current_prob': 0.965,
@@ -56,9 +67,7 @@ def main():
         'annualized_yield': 4.5,
         'charm': 9.0
     }
-    result1 = calculate_opportunity_score(**params1)
-    
-    print_scenario(
+    scenarios.append((
         "🎯 Scenario 1: The Ideal Trade Setup",
         """
 You find a market at 96.5% probability with 8.5 days to expiry.
@@ -73,9 +82,8 @@ INTERPRETATION: This is exactly what the system looks for.
    Perfect distance-time fit + strong fundamentals = Top grade.
    This is a STRONG BUY signal.
         """,
-        result1,
         params1
-    )
+    ))
     
     # Scenario 2: Too Close for Comfort
     params2 = {
@@ -91,9 +99,7 @@ INTERPRETATION: This is exactly what the system looks for.
         'annualized_yield': 1.5,
         'charm': 25.0
     }
-    result2 = calculate_opportunity_score(**params2)
-    
-    print_scenario(
+    scenarios.append((
         "⚠️  Scenario 2: Too Close for Comfort",
         """
 You find a market at 99.3% probability with 5 days to expiry.
@@ -108,9 +114,8 @@ INTERPRETATION: Despite perfect fundamentals, proximity to
    penalizes this - it's not worth the risk/reward.
    This is a PASS.
         """,
-        result2,
         params2
-    )
+    ))
     
     # Scenario 3: The Long Shot
     params3 = {
@@ -126,9 +131,7 @@ INTERPRETATION: Despite perfect fundamentals, proximity to
         'annualized_yield': 3.0,
         'charm': 3.0
     }
-    result3 = calculate_opportunity_score(**params3)
-    
-    print_scenario(
+    scenarios.append((
         "📉 Scenario 3: The Long Shot",
         """
 You find a market at 80% probability with 25 days to expiry.
@@ -142,9 +145,8 @@ INTERPRETATION: Too far from the extreme and too long to expiry.
    The system wants 2-5% distance in 7-10 days, not this.
    This is a MAYBE - consider but not priority.
         """,
-        result3,
         params3
-    )
+    ))
     
     # Scenario 4: Low Liquidity Gem
     params4 = {
@@ -160,9 +162,7 @@ INTERPRETATION: Too far from the extreme and too long to expiry.
         'annualized_yield': 3.8,
         'charm': 7.5
     }
-    result4 = calculate_opportunity_score(**params4)
-    
-    print_scenario(
+    scenarios.append((
         "💎 Scenario 4: Low Liquidity Gem",
         """
 You find a market at 97% probability with 9 days to expiry.
@@ -177,9 +177,8 @@ INTERPRETATION: Great positioning but liquidity concerns.
    the size you want. For small trades, this is good.
    This is a CONDITIONAL BUY - size dependent.
         """,
-        result4,
         params4
-    )
+    ))
     
     # Scenario 5: The Sprint
     params5 = {
@@ -195,9 +194,7 @@ INTERPRETATION: Great positioning but liquidity concerns.
         'annualized_yield': 25.0,
         'charm': 30.0
     }
-    result5 = calculate_opportunity_score(**params5)
-    
-    print_scenario(
+    scenarios.append((
         "⚡ Scenario 5: The Sprint",
         """
 You find a market at 96% probability expiring in 1.5 days.
@@ -214,9 +211,8 @@ INTERPRETATION: This is a fast-moving momentum play, not
    not what the strategy optimizes for.
    This is a TACTICAL OPPORTUNITY - different strategy.
         """,
-        result5,
         params5
-    )
+    ))
     
     # Scenario 6: Counter-Trend Setup
     params6 = {
@@ -232,9 +228,7 @@ INTERPRETATION: This is a fast-moving momentum play, not
         'annualized_yield': 3.5,
         'charm': 6.0
     }
-    result6 = calculate_opportunity_score(**params6)
-    
-    print_scenario(
+    scenarios.append((
         "🔄 Scenario 6: Counter-Trend Setup",
         """
 You find a market at 96.5% probability with 8 days to expiry.
@@ -249,9 +243,16 @@ INTERPRETATION: Perfect positioning but momentum misalignment
    score significantly (0.65x multiplier vs 1.25x for alignment).
    This is a CAUTION - investigate why momentum is opposite.
         """,
-        result6,
         params6
-    )
+    ))
+    
+    # Score all scenarios in a single batched pass
+    all_params = [params for _, _, params in scenarios]
+    arrays = {key: np.array([params[key] for params in all_params]) for key in all_params[0]}
+    results = split_opportunity_scores(calculate_opportunity_score_batch(**arrays))
+    
+    for (title, description, params), result in zip(scenarios, results):
+        print_scenario(title, description, result, params)
     
     # Summary
     print("\n" + "="*80)
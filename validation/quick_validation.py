@@ -1,12 +1,13 @@
 """
 Quick validation runner - runs all tests and shows summary.
+
+Run from the repository root:
+    python -m validation.quick_validation
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from test_scoring_validation import run_realistic_scenarios, run_edge_cases, run_randomized_tests, run_comparative_analysis
+from validation.test_scoring_validation import run_realistic_scenarios, run_edge_cases, run_randomized_tests, run_comparative_analysis
 
 
 def main():
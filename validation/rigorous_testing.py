@@ -1,42 +1,80 @@
 """
 Rigorous scenario testing to identify scoring issues.
 Tests edge cases and realistic scenarios to find non-sensible behavior.
+
+Run from the repository root:
+    python -m validation.rigorous_testing
 """
 
+import argparse
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import calculate_opportunity_score
+import numpy as np
+import pandas as pd
+
+from app import ScoringInputs, score_inputs, calculate_opportunity_score_batch, split_opportunity_scores
+
+
+def score_group(params, **sweeps):
+    """
+    Score params with some fields swept over value lists, in one
+    vectorized pass. Fixed fields broadcast against the sweeps.
+    """
+    arrays = {**params, **{key: np.asarray(values) for key, values in sweeps.items()}}
+    return split_opportunity_scores(calculate_opportunity_score_batch(**arrays))
 
 
-def test_scenario(name, params, expected_behavior):
+def test_scenario(name, params, expected_behavior, result=None, verbose=True):
     """Test a scenario and check if it makes sense."""
-    result = calculate_opportunity_score(**params)
-    score = result['total_score']
-    
-    print(f"\n{'='*80}")
-    print(f"{name}")
-    print(f"{'='*80}")
-    print(f"Prob: {params['current_prob']:.1%} | Distance: {result['distance_to_target']*100:.1f}% | Days: {result['days_to_expiry']:.1f}")
-    print(f"Volume: ${params['volume']:,} | Spread: {((params['best_ask']-params['best_bid'])/params['current_prob']*100):.2f}%")
-    print(f"Momentum: {params['momentum']:.2f} | APY: {params['annualized_yield']:.1f}% | Charm: {params['charm']:.1f}")
-    print(f"\nSCORE: {score:.1f}/100 | Grade: {result['grade']} | Sweet Spot: {result['in_sweet_spot']}")
-    
-    print(f"\nComponents:")
-    for comp, val in result['components'].items():
-        print(f"  {comp:20s}: {val:6.2f}")
+    if result is None:
+        result = score_inputs(ScoringInputs(**params))
+    if not verbose:
+        return result
+    
+    score = result.total_score
+    lines = [
+        f"\n{'='*80}",
+        f"{name}",
+        f"{'='*80}",
+        f"Prob: {params['current_prob']:.1%} | Distance: {result.distance_to_target*100:.1f}% | Days: {result.days_to_expiry:.1f}",
+        f"Volume: ${params['volume']:,} | Spread: {((params['best_ask']-params['best_bid'])/params['current_prob']*100):.2f}%",
+        f"Momentum: {params['momentum']:.2f} | APY: {params['annualized_yield']:.1f}% | Charm: {params['charm']:.1f}",
+        f"\nSCORE: {score:.1f}/100 | Grade: {result.grade} | Sweet Spot: {result.in_sweet_spot}",
+        f"\nComponents:",
+    ]
+    for comp, val in result.components._asdict().items():
+        lines.append(f"  {comp:20s}: {val:6.2f}")
+    lines.append(f"\nExpected: {expected_behavior}")
     
-    print(f"\nExpected: {expected_behavior}")
+    # Emit the whole block with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return result
 
 
-def main():
-    print("\n" + "="*80)
-    print("RIGOROUS SCENARIO TESTING - Identifying Scoring Issues")
-    print("="*80)
-    
+def print_table(title, header, width, rows):
+    """Print an analysis table (title, header, rule, rows) with a single write."""
+    sys.stdout.write("\n".join([f"\n\n{title}", header, "-" * width, *rows]) + "\n")
+
+
+# Shared starting point; each group varies one or two fields
+BASE_PARAMS = {
+    'momentum': 0.30,
+    'hours_to_expiry': 8 * 24,
+    'volume': 1_000_000,
+    'best_bid': 0.96,
+    'best_ask': 0.97,
+    'direction': 'YES',
+    'one_day_change': 0.05,
+    'one_week_change': 0.10,
+    'annualized_yield': 3.0,
+    'charm': 6.0
+}
+
+
+def run_distance_group(verbose=True):
+    """Test group 1: distance sensitivity. Returns (issues, table columns)."""
     issues = []
     
     # Test 1: Compare similar markets with one key difference
@@ -44,19 +82,6 @@ def main():
     print("TEST GROUP 1: DISTANCE SENSITIVITY")
     print("="*80)
     
-    base = {
-        'momentum': 0.30,
-        'hours_to_expiry': 8 * 24,
-        'volume': 1_000_000,
-        'best_bid': 0.96,
-        'best_ask': 0.97,
-        'direction': 'YES',
-        'one_day_change': 0.05,
-        'one_week_change': 0.10,
-        'annualized_yield': 3.0,
-        'charm': 6.0
-    }
-    
     distances = [
         (0.995, "0.5% - Too close"),
         (0.98, "2% - Sweet spot edge"),
@@ -67,32 +92,47 @@ def main():
         (0.70, "30% - Very far")
     ]
     
-    distance_scores = []
-    for prob, desc in distances:
-        params = base.copy()
+    # One working dict per group; the swept field is overwritten in place
+    params = dict(BASE_PARAMS)
+    results = score_group(params, current_prob=[prob for prob, _ in distances])
+    
+    distance_scores = np.empty((len(distances), 3))  # columns: prob, total, dist_fit
+    for i, ((prob, desc), result) in enumerate(zip(distances, results)):
         params['current_prob'] = prob
-        result = test_scenario(f"Distance: {desc}", params, f"Should score based on {desc}")
-        distance_scores.append((prob, result['total_score'], result['components']['distance_time_fit']))
+        test_scenario(f"Distance: {desc}", params, f"Should score based on {desc}", result, verbose=verbose)
+        distance_scores[i] = (prob, result.total_score, result.components.distance_time_fit)
     
-    print("\n\nDistance Progression Analysis:")
-    print(f"{'Distance':<15} {'Total Score':<15} {'Dist-Time Fit':<15}")
-    print("-" * 45)
-    for prob, total, dist_fit in distance_scores:
-        dist_pct = (1.0 - prob) * 100
-        print(f"{dist_pct:6.1f}%        {total:6.1f}         {dist_fit:6.1f}")
+    print_table(
+        "Distance Progression Analysis:",
+        f"{'Distance':<15} {'Total Score':<15} {'Dist-Time Fit':<15}", 45,
+        [f"{(1.0 - prob) * 100:6.1f}%        {total:6.1f}         {dist_fit:6.1f}"
+         for prob, total, dist_fit in distance_scores]
+    )
     
     # Check if progression makes sense
     # Sweet spot (2-5%) should score highest
-    sweet_spot_scores = [s for p, s, _ in distance_scores if 0.95 <= p <= 0.98]
-    outside_scores = [s for p, s, _ in distance_scores if p < 0.92 or p > 0.99]
+    probs = distance_scores[:, 0]
+    sweet_mask = (probs >= 0.95) & (probs <= 0.98)
+    outside_mask = (probs < 0.92) | (probs > 0.99)
     
-    if sweet_spot_scores and outside_scores:
-        avg_sweet = sum(sweet_spot_scores) / len(sweet_spot_scores)
-        avg_outside = sum(outside_scores) / len(outside_scores)
+    if sweet_mask.any() and outside_mask.any():
+        avg_sweet = distance_scores[sweet_mask, 1].mean()
+        avg_outside = distance_scores[outside_mask, 1].mean()
         print(f"\nSweet spot avg: {avg_sweet:.1f} | Outside avg: {avg_outside:.1f}")
         if avg_sweet <= avg_outside:
             issues.append("❌ Sweet spot not scoring higher than outside range!")
     
+    return issues, {
+        'distance_pct': (1.0 - distance_scores[:, 0]) * 100,
+        'total_score': distance_scores[:, 1],
+        'dist_time_fit': distance_scores[:, 2]
+    }
+
+
+def run_time_group(verbose=True):
+    """Test group 2: time sensitivity. Returns (issues, table columns)."""
+    issues = []
+    
     # Test 2: TIME SENSITIVITY
     print("\n\n" + "="*80)
     print("TEST GROUP 2: TIME SENSITIVITY")
@@ -109,19 +149,32 @@ def main():
         (60 * 24, "60 days - Very long")
     ]
     
-    time_scores = []
-    for hours, desc in time_tests:
-        params = base.copy()
-        params['current_prob'] = 0.965  # Keep at sweet spot distance
-        params['hours_to_expiry'] = hours
-        result = test_scenario(f"Time: {desc}", params, f"Should score based on {desc}")
-        time_scores.append((hours/24, result['total_score'], result['components']['distance_time_fit']))
+    params = dict(BASE_PARAMS, current_prob=0.965)  # Keep at sweet spot distance
+    results = score_group(params, hours_to_expiry=[hours for hours, _ in time_tests])
     
-    print("\n\nTime Progression Analysis:")
-    print(f"{'Days':<15} {'Total Score':<15} {'Dist-Time Fit':<15}")
-    print("-" * 45)
-    for days, total, dist_fit in time_scores:
-        print(f"{days:6.1f}         {total:6.1f}         {dist_fit:6.1f}")
+    time_scores = np.empty((len(time_tests), 3))  # columns: days, total, dist_fit
+    for i, ((hours, desc), result) in enumerate(zip(time_tests, results)):
+        params['hours_to_expiry'] = hours
+        test_scenario(f"Time: {desc}", params, f"Should score based on {desc}", result, verbose=verbose)
+        time_scores[i] = (hours/24, result.total_score, result.components.distance_time_fit)
+    
+    print_table(
+        "Time Progression Analysis:",
+        f"{'Days':<15} {'Total Score':<15} {'Dist-Time Fit':<15}", 45,
+        [f"{days:6.1f}         {total:6.1f}         {dist_fit:6.1f}"
+         for days, total, dist_fit in time_scores]
+    )
+    
+    return issues, {
+        'days': time_scores[:, 0],
+        'total_score': time_scores[:, 1],
+        'dist_time_fit': time_scores[:, 2]
+    }
+
+
+def run_volume_group(verbose=True):
+    """Test group 3: volume impact. Returns (issues, table columns)."""
+    issues = []
     
     # Test 3: VOLUME IMPACT
     print("\n\n" + "="*80)
@@ -138,27 +191,28 @@ def main():
         (20_000_000, "$20M - Massive liquidity")
     ]
     
-    volume_scores = []
-    for vol, desc in volume_tests:
-        params = base.copy()
-        params['current_prob'] = 0.965
-        params['hours_to_expiry'] = 8.5 * 24
+    params = dict(BASE_PARAMS, current_prob=0.965, hours_to_expiry=8.5 * 24)
+    results = score_group(params, volume=[vol for vol, _ in volume_tests])
+    
+    volume_scores = np.empty((len(volume_tests), 3))  # columns: volume, total, vol_comp
+    for i, ((vol, desc), result) in enumerate(zip(volume_tests, results)):
         params['volume'] = vol
-        result = test_scenario(f"Volume: {desc}", params, f"Should reflect {desc}")
-        volume_scores.append((vol, result['total_score'], result['components']['volume']))
-    
-    print("\n\nVolume Impact Analysis:")
-    print(f"{'Volume':<20} {'Total Score':<15} {'Volume Component':<15} {'Delta':<10}")
-    print("-" * 60)
-    prev_total = None
-    for vol, total, vol_comp in volume_scores:
-        delta_str = f"+{total - prev_total:.1f}" if prev_total else "---"
-        print(f"${vol:>18,}   {total:6.1f}         {vol_comp:6.1f}            {delta_str}")
-        prev_total = total
+        test_scenario(f"Volume: {desc}", params, f"Should reflect {desc}", result, verbose=verbose)
+        volume_scores[i] = (vol, result.total_score, result.components.volume)
+    
+    totals = volume_scores[:, 1]
+    deltas = ["---"] + [f"+{total - prev_total:.1f}" if prev_total else "---"
+                        for prev_total, total in zip(totals[:-1], totals[1:])]
+    print_table(
+        "Volume Impact Analysis:",
+        f"{'Volume':<20} {'Total Score':<15} {'Volume Component':<15} {'Delta':<10}", 60,
+        [f"${vol:>18,.0f}   {total:6.1f}         {vol_comp:6.1f}            {delta_str}"
+         for (vol, total, vol_comp), delta_str in zip(volume_scores, deltas)]
+    )
     
     # Check: Zero volume should significantly hurt score
-    zero_vol_score = volume_scores[0][1]
-    high_vol_score = volume_scores[-1][1]
+    zero_vol_score = volume_scores[0, 1]
+    high_vol_score = volume_scores[-1, 1]
     vol_diff = high_vol_score - zero_vol_score
     
     if vol_diff < 10:
@@ -168,6 +222,17 @@ def main():
     else:
         print(f"\n✅ Volume impact reasonable: {vol_diff:.1f} point difference")
     
+    return issues, {
+        'volume': volume_scores[:, 0],
+        'total_score': volume_scores[:, 1],
+        'volume_component': volume_scores[:, 2]
+    }
+
+
+def run_apy_group(verbose=True):
+    """Test group 4: APY scaling. Returns (issues, table columns)."""
+    issues = []
+    
     # Test 4: APY SCALING
     print("\n\n" + "="*80)
     print("TEST GROUP 4: APY SCALING")
@@ -183,20 +248,32 @@ def main():
         (100.0, "10000% APY - Crazy high")
     ]
     
-    apy_scores = []
-    for apy, desc in apy_tests:
-        params = base.copy()
-        params['current_prob'] = 0.965
-        params['hours_to_expiry'] = 8.5 * 24
-        params['annualized_yield'] = apy
-        result = test_scenario(f"APY: {desc}", params, f"Should reflect {desc}")
-        apy_scores.append((apy, result['total_score'], result['components']['apy']))
+    params = dict(BASE_PARAMS, current_prob=0.965, hours_to_expiry=8.5 * 24)
+    results = score_group(params, annualized_yield=[apy for apy, _ in apy_tests])
     
-    print("\n\nAPY Scaling Analysis:")
-    print(f"{'APY %':<15} {'Total Score':<15} {'APY Component':<15}")
-    print("-" * 45)
-    for apy, total, apy_comp in apy_scores:
-        print(f"{apy*100:6.0f}%        {total:6.1f}         {apy_comp:6.1f}")
+    apy_scores = np.empty((len(apy_tests), 3))  # columns: apy, total, apy_comp
+    for i, ((apy, desc), result) in enumerate(zip(apy_tests, results)):
+        params['annualized_yield'] = apy
+        test_scenario(f"APY: {desc}", params, f"Should reflect {desc}", result, verbose=verbose)
+        apy_scores[i] = (apy, result.total_score, result.components.apy)
+    
+    print_table(
+        "APY Scaling Analysis:",
+        f"{'APY %':<15} {'Total Score':<15} {'APY Component':<15}", 45,
+        [f"{apy*100:6.0f}%        {total:6.1f}         {apy_comp:6.1f}"
+         for apy, total, apy_comp in apy_scores]
+    )
+    
+    return issues, {
+        'apy_pct': apy_scores[:, 0] * 100,
+        'total_score': apy_scores[:, 1],
+        'apy_component': apy_scores[:, 2]
+    }
+
+
+def run_momentum_group(verbose=True):
+    """Test group 5: momentum alignment. Returns (issues, table columns)."""
+    issues = []
     
     # Test 5: MOMENTUM ALIGNMENT
     print("\n\n" + "="*80)
@@ -210,26 +287,30 @@ def main():
         (0.30, -0.05, -0.10, "Both misaligned"),
     ]
     
-    momentum_scores = []
-    for mom, d1, d7, desc in momentum_tests:
-        params = base.copy()
-        params['current_prob'] = 0.965
-        params['hours_to_expiry'] = 8.5 * 24
-        params['momentum'] = mom
-        params['one_day_change'] = d1
-        params['one_week_change'] = d7
-        result = test_scenario(f"Momentum: {desc}", params, f"Should reflect {desc}")
-        momentum_scores.append((desc, result['total_score'], result['components']['momentum']))
-    
-    print("\n\nMomentum Alignment Analysis:")
-    print(f"{'Alignment':<30} {'Total Score':<15} {'Momentum Comp':<15}")
-    print("-" * 60)
-    for desc, total, mom_comp in momentum_scores:
-        print(f"{desc:<30} {total:6.1f}         {mom_comp:6.1f}")
+    params = dict(BASE_PARAMS, current_prob=0.965, hours_to_expiry=8.5 * 24)
+    results = score_group(
+        params,
+        momentum=[mom for mom, _, _, _ in momentum_tests],
+        one_day_change=[d1 for _, d1, _, _ in momentum_tests],
+        one_week_change=[d7 for _, _, d7, _ in momentum_tests]
+    )
+    
+    momentum_scores = np.empty((len(momentum_tests), 2))  # columns: total, mom_comp
+    for i, ((mom, d1, d7, desc), result) in enumerate(zip(momentum_tests, results)):
+        params.update(momentum=mom, one_day_change=d1, one_week_change=d7)
+        test_scenario(f"Momentum: {desc}", params, f"Should reflect {desc}", result, verbose=verbose)
+        momentum_scores[i] = (result.total_score, result.components.momentum)
+    
+    print_table(
+        "Momentum Alignment Analysis:",
+        f"{'Alignment':<30} {'Total Score':<15} {'Momentum Comp':<15}", 60,
+        [f"{desc:<30} {total:6.1f}         {mom_comp:6.1f}"
+         for (_, _, _, desc), (total, mom_comp) in zip(momentum_tests, momentum_scores)]
+    )
     
     # Both aligned should score highest
-    both_aligned = momentum_scores[0][1]
-    both_misaligned = momentum_scores[3][1]
+    both_aligned = momentum_scores[0, 0]
+    both_misaligned = momentum_scores[3, 0]
     momentum_diff = both_aligned - both_misaligned
     
     if momentum_diff < 3:
@@ -237,6 +318,17 @@ def main():
     else:
         print(f"\nMomentum alignment impact: {momentum_diff:.1f} points")
     
+    return issues, {
+        'alignment': [desc for _, _, _, desc in momentum_tests],
+        'total_score': momentum_scores[:, 0],
+        'momentum_component': momentum_scores[:, 1]
+    }
+
+
+def run_spread_group(verbose=True):
+    """Test group 6: spread quality. Returns (issues, table columns)."""
+    issues = []
+    
     # Test 6: SPREAD QUALITY
     print("\n\n" + "="*80)
     print("TEST GROUP 6: SPREAD QUALITY")
@@ -251,22 +343,72 @@ def main():
         (0.90, 1.00, "10% - Extreme")
     ]
     
-    spread_scores = []
-    for bid, ask, desc in spread_tests:
-        params = base.copy()
-        params['current_prob'] = 0.965
-        params['hours_to_expiry'] = 8.5 * 24
-        params['best_bid'] = bid
-        params['best_ask'] = ask
+    params = dict(BASE_PARAMS, current_prob=0.965, hours_to_expiry=8.5 * 24)
+    results = score_group(
+        params,
+        best_bid=[bid for bid, _, _ in spread_tests],
+        best_ask=[ask for _, ask, _ in spread_tests]
+    )
+    
+    spread_scores = np.empty((len(spread_tests), 3))  # columns: spread_pct, total, spread_comp
+    for i, ((bid, ask, desc), result) in enumerate(zip(spread_tests, results)):
+        params.update(best_bid=bid, best_ask=ask)
         spread_pct = (ask - bid) / 0.965 * 100
-        result = test_scenario(f"Spread: {desc}", params, f"Should reflect {desc}")
-        spread_scores.append((spread_pct, result['total_score'], result['components']['spread']))
+        test_scenario(f"Spread: {desc}", params, f"Should reflect {desc}", result, verbose=verbose)
+        spread_scores[i] = (spread_pct, result.total_score, result.components.spread)
+    
+    print_table(
+        "Spread Impact Analysis:",
+        f"{'Spread %':<15} {'Total Score':<15} {'Spread Comp':<15}", 45,
+        [f"{spread:6.2f}%       {total:6.1f}         {spread_comp:6.1f}"
+         for spread, total, spread_comp in spread_scores]
+    )
+    
+    return issues, {
+        'spread_pct': spread_scores[:, 0],
+        'total_score': spread_scores[:, 1],
+        'spread_component': spread_scores[:, 2]
+    }
+
+
+def write_tables(tables, output_dir):
+    """
+    Save each group's analysis table as Parquet, or CSV when pyarrow
+    isn't installed.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for name, table in tables.items():
+        df = pd.DataFrame(table)
+        try:
+            df.to_parquet(os.path.join(output_dir, f"{name}.parquet"), index=False)
+        except ImportError:
+            df.to_csv(os.path.join(output_dir, f"{name}.csv"), index=False)
+
+
+def main(output_dir=None):
+    print("\n" + "="*80)
+    print("RIGOROUS SCENARIO TESTING - Identifying Scoring Issues")
+    print("="*80)
     
-    print("\n\nSpread Impact Analysis:")
-    print(f"{'Spread %':<15} {'Total Score':<15} {'Spread Comp':<15}")
-    print("-" * 45)
-    for spread, total, spread_comp in spread_scores:
-        print(f"{spread:6.2f}%       {total:6.1f}         {spread_comp:6.1f}")
+    # QUIET=1 skips the per-scenario reports (analysis tables still print)
+    verbose = os.environ.get('QUIET') != '1'
+    issues = []
+    tables = {}
+    group_issues, tables['distance'] = run_distance_group(verbose)
+    issues.extend(group_issues)
+    group_issues, tables['time'] = run_time_group(verbose)
+    issues.extend(group_issues)
+    group_issues, tables['volume'] = run_volume_group(verbose)
+    issues.extend(group_issues)
+    group_issues, tables['apy'] = run_apy_group(verbose)
+    issues.extend(group_issues)
+    group_issues, tables['momentum'] = run_momentum_group(verbose)
+    issues.extend(group_issues)
+    group_issues, tables['spread'] = run_spread_group(verbose)
+    issues.extend(group_issues)
+    
+    if output_dir:
+        write_tables(tables, output_dir)
     
     # FINAL SUMMARY
     print("\n\n" + "="*80)
@@ -316,4 +458,8 @@ Based on rigorous testing, here are recommendations:
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Rigorous scenario testing of the opportunity scorer")
+    parser.add_argument("--output-dir", help="Also save each group's analysis table (Parquet, or CSV without pyarrow)")
+    args = parser.parse_args()
+    
+    main(output_dir=args.output_dir)